@@ -14,8 +14,8 @@ class AudioPlayer:
     2. Memuat musik dan efek suara
     3. Mengatur volume efek suara
     """
-    def __init__(self):
-        self.has_audio = _HAS_PYGAME
+    def __init__(self, enabled: bool = True):
+        self.has_audio = _HAS_PYGAME and enabled
         self.bgm = None
         self.sfx_score = None
         self.sfx_miss = None
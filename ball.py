@@ -5,10 +5,15 @@ from config import SCREEN_WIDTH, SCREEN_HEIGHT, GRAVITY, FLIGHT_TIME, COLOR_BALL
 import numpy as np
 class Ball:
     """Objek bola basket: posisi, gravitasi, scoring chance, dan trajectory."""
-    def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float, current_accuracy: float, target_accuracy: float):
+    def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float, current_accuracy: float, target_accuracy: float,
+                 bounds: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT), unit: float = 1.0):
+        # unit: ukuran 1 piksel layout referensi 720p dalam koordinat dunia (GameRenderer.unit)
+        self.bounds = bounds
+        self.unit = unit
+        self.gravity = GRAVITY * unit
         self.x = float(start_x)
         self.y = float(start_y)
-        self.radius = 18
+        self.radius = int(round(18 * unit))
         self.active = True
         self.trajectory: List[Tuple[int, int]] = []
         self.final_accuracy = float(current_accuracy)
@@ -40,28 +45,29 @@ class Ball:
         - Jika akurasi tinggi: lintasan lebih ideal
         """
         actual = self.final_accuracy
+        u = self.unit
         adjusted_x, adjusted_y = tx, ty
         if actual < 75:
-            undershoot = (75 - actual) * 5
-            adjusted_x = tx - undershoot - 50
-            adjusted_y = ty + 30
+            undershoot = (75 - actual) * 5 * u
+            adjusted_x = tx - undershoot - 50 * u
+            adjusted_y = ty + 30 * u
         elif actual <= 100:
-            max_error = (100 - actual) * 0.8
+            max_error = (100 - actual) * 0.8 * u
             if self.will_score:
                 adjusted_x = tx + random.uniform(-max_error * 0.3, max_error * 0.3)
                 adjusted_y = ty
             else:
                 adjusted_x = tx + random.uniform(-max_error * 2, max_error * 2)
-                adjusted_y = ty + random.uniform(-10, 15)
+                adjusted_y = ty + random.uniform(-10, 15) * u
         else:
-            overshoot = (actual - 100) * 4
-            adjusted_x = tx + overshoot + 30
-            adjusted_y = ty - 20
+            overshoot = (actual - 100) * 4 * u
+            adjusted_x = tx + overshoot + 30 * u
+            adjusted_y = ty - 20 * u
 
         dx = adjusted_x - self.x
         dy = adjusted_y - self.y
         t = FLIGHT_TIME
-        g = GRAVITY
+        g = self.gravity
         self.vx = dx / t
         self.vy = (dy - 0.5 * g * t * t) / t
 
@@ -76,37 +82,43 @@ class Ball:
             return None
         self.x += self.vx * dt
         self.y += self.vy * dt
-        self.vy += GRAVITY * dt
+        self.vy += self.gravity * dt
 
         self.trajectory.append((int(self.x), int(self.y)))
         if len(self.trajectory) > 15:
             self.trajectory.pop(0)
 
-        if basket_y - self.radius <= self.y <= basket_y + 30:
+        u = self.unit
+        if basket_y - self.radius <= self.y <= basket_y + 30 * u:
             dist = abs(self.x - basket_x)
             if dist < basket_rim_radius:
                 if self.will_score and self.vy > 0:
                     self.active = False
                     return "score"
-                elif not self.will_score and dist < (basket_rim_radius - 5):
+                elif not self.will_score and dist < (basket_rim_radius - 5 * u):
                     self.vy = -abs(self.vy) * 0.3
-                    self.vx += random.uniform(-100, 100)
+                    self.vx += random.uniform(-100, 100) * u
 
-        if self.x > SCREEN_WIDTH + 50 or self.x < -50 or self.y > SCREEN_HEIGHT + 50:
+        width, height = self.bounds
+        margin = 50 * u
+        if self.x > width + margin or self.x < -margin or self.y > height + margin:
             self.active = False
             return "miss"
         return None
 
-    def draw(self, frame: np.ndarray):
-        """Menggambar bola dan bayangan serta jejak lintasan."""
+    def draw(self, frame: np.ndarray, scale: float = 1.0):
+        """Menggambar bola dan bayangan serta jejak lintasan (scale: koordinat dunia → canvas renderer)."""
         if not self.active:
             return
-        shadow_y = SCREEN_HEIGHT - 80
-        cv2.ellipse(frame, (int(self.x), shadow_y), (self.radius, 5), 0, 0, 360, (100, 100, 100), -1)
+        u = self.unit * scale
+        p = lambda x, y: (int(x * scale), int(y * scale))
+        radius = max(1, int(self.radius * scale))
+        shadow_y = self.bounds[1] - 80 * self.unit
+        cv2.ellipse(frame, p(self.x, shadow_y), (radius, max(1, int(5 * u))), 0, 0, 360, (100, 100, 100), -1)
         for i in range(len(self.trajectory) - 1):
             alpha = i / max(1, len(self.trajectory))
-            thickness = int(2 + alpha * 3)
-            cv2.line(frame, self.trajectory[i], self.trajectory[i + 1], COLOR_BALL, thickness)
-        cv2.circle(frame, (int(self.x), int(self.y)), self.radius, COLOR_BALL, -1)
-        cv2.circle(frame, (int(self.x - 5), int(self.y - 5)), int(self.radius * 0.6), (0, 180, 255), -1)
-        cv2.circle(frame, (int(self.x), int(self.y)), self.radius, (0, 0, 0), 2)
+            thickness = max(1, int((2 + alpha * 3) * u))
+            cv2.line(frame, p(*self.trajectory[i]), p(*self.trajectory[i + 1]), COLOR_BALL, thickness)
+        cv2.circle(frame, p(self.x, self.y), radius, COLOR_BALL, -1)
+        cv2.circle(frame, p(self.x - 5 * self.unit, self.y - 5 * self.unit), int(radius * 0.6), (0, 180, 255), -1)
+        cv2.circle(frame, p(self.x, self.y), radius, (0, 0, 0), max(1, int(round(2 * u))))
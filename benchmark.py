@@ -0,0 +1,368 @@
+"""
+Benchmark headless untuk Voice Free Throw (tanpa kamera, mikrofon, maupun jendela).
+
+    python benchmark.py frames [--frames N]
+    python benchmark.py record [--frames N]
+    python benchmark.py store [--shots N] [--players N]
+    python benchmark.py tracker --video rekaman_dua_tangan.mp4 [--frames N]
+    python benchmark.py scheduler [--seconds N] [--players N]
+    python benchmark.py render [--frames N]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+import cv2
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, CAMERA_WIDTH, CAMERA_HEIGHT, PREVIEW_WIDTH, PREVIEW_HEIGHT
+from renderer import GameRenderer
+from frame_pool import FrameBufferPool
+from kernel_video import enhance_frame
+from recorder import SessionRecorder, VideoFileSink
+from score_store import ScoreStore
+from ball import Ball
+
+def _synthetic_camera(n: int):
+    """Frame kamera sintetis yang berubah setiap iterasi (noise + gradasi bergerak)."""
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (CAMERA_HEIGHT, CAMERA_WIDTH, 3), dtype=np.uint8)
+    return [np.roll(base, i * 7, axis=1) for i in range(n)]
+
+def _legacy_frame(renderer: GameRenderer, raw: np.ndarray) -> np.ndarray:
+    """Pipeline per-frame versi lama: alokasi frame, copy, RGB, dan preview baru setiap frame."""
+    hand_frame = raw.copy()
+    hand_frame = cv2.GaussianBlur(hand_frame, (3, 3), 0)
+    hand_frame = cv2.filter2D(hand_frame, -1, np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]]))
+    hand_frame = cv2.convertScaleAbs(hand_frame, alpha=1.12, beta=8)
+    b, g, r = cv2.split(hand_frame.astype(np.float32))
+    avg = (np.mean(b) + np.mean(g) + np.mean(r)) / 3.0
+    b = np.clip(b * (avg / (np.mean(b) + 1e-6)), 0, 255)
+    g = np.clip(g * (avg / (np.mean(g) + 1e-6)), 0, 255)
+    r = np.clip(r * (avg / (np.mean(r) + 1e-6)), 0, 255)
+    hand_frame = cv2.merge([b, g, r]).astype(np.uint8)
+    cv2.cvtColor(hand_frame, cv2.COLOR_BGR2RGB)
+    frame = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
+    renderer.draw_background(frame)
+    renderer.draw_basket(frame)
+    renderer.draw_player(frame, hand_ready=True)
+    preview = cv2.resize(hand_frame, (PREVIEW_WIDTH, PREVIEW_HEIGHT))
+    frame[SCREEN_HEIGHT - 185:SCREEN_HEIGHT - 20, SCREEN_WIDTH - 240:SCREEN_WIDTH - 20] = preview
+    cv2.rectangle(frame, (SCREEN_WIDTH - 240, SCREEN_HEIGHT - 185), (SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20), (0, 255, 0), 2)
+    return frame
+
+def _pooled_frame(renderer: GameRenderer, raw: np.ndarray, buffers: FrameBufferPool) -> np.ndarray:
+    """
+    Pipeline per-frame dengan FrameBufferPool, mengikuti VoiceFreeThrow:
+    task tracking (enhance, RGB, resize ke preview_src) lalu render_step
+    (begin/present renderer, salin preview ke frame output, bingkai preview).
+    """
+    buffers.bind_camera(raw.shape)
+    hand_frame = enhance_frame(raw, out=buffers.hand, work=buffers.work)
+    cv2.cvtColor(hand_frame, cv2.COLOR_BGR2RGB, dst=buffers.rgb)
+    cv2.resize(hand_frame, (PREVIEW_WIDTH, PREVIEW_HEIGHT), dst=buffers.preview_src)
+    frame = buffers.frame
+    target = renderer.begin(frame)
+    renderer.draw_background(target)
+    renderer.draw_basket(target)
+    renderer.draw_player(target, hand_ready=True)
+    renderer.present(frame)
+    np.copyto(buffers.preview, buffers.preview_src)
+    cv2.rectangle(frame, *buffers.preview_rect, (0, 255, 0), 2)
+    return frame
+
+def _profile(step, frames, alloc: bool = True):
+    """Mengukur waktu per frame (ms) lalu (opsional) alokasi puncak per frame (byte) dengan tracemalloc."""
+    for raw in frames[:10]:
+        step(raw)
+    times = []
+    for raw in frames:
+        t0 = time.perf_counter()
+        step(raw)
+        times.append((time.perf_counter() - t0) * 1000.0)
+    if not alloc:
+        return times, []
+    tracemalloc.start()
+    peaks = []
+    for raw in frames:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        step(raw)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    tracemalloc.stop()
+    return times, peaks
+
+def bench_frames(n: int):
+    """Membandingkan pipeline lama vs buffer pool: alokasi per frame dan jitter frame time."""
+    frames = _synthetic_camera(n)
+    renderer = GameRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+    buffers = FrameBufferPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    cases = [
+        ("legacy", lambda raw: _legacy_frame(renderer, raw)),
+        ("pooled", lambda raw: _pooled_frame(renderer, raw, buffers)),
+    ]
+    print(f"{'pipeline':<10}{'mean ms':>10}{'stdev ms':>10}{'p99 ms':>10}{'alloc KiB/frame':>18}")
+    for name, step in cases:
+        times, peaks = _profile(step, frames)
+        p99 = sorted(times)[int(len(times) * 0.99) - 1]
+        print(f"{name:<10}{statistics.mean(times):>10.3f}{statistics.stdev(times):>10.3f}{p99:>10.3f}"
+              f"{statistics.mean(peaks) / 1024.0:>18.1f}")
+
+class _SlowSink:
+    """Sink tiruan yang mensimulasikan encoder lambat (lebih lambat dari frame rate game)."""
+    path = "slow-sink"
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, frame: np.ndarray):
+        time.sleep(self.delay)
+
+    def release(self):
+        pass
+
+def bench_record(n: int):
+    """
+    Frame time game loop (dipacing pada FPS, seperti kamera) dengan rekaman mati,
+    encoder file nyata, encoder lambat (drop-oldest), serta file + encoder lambat
+    sekaligus (file tidak boleh ikut membuang frame karena sink yang lambat).
+    """
+    frames = _synthetic_camera(n)
+    renderer = GameRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
+    buffers = FrameBufferPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    tmp_dir = tempfile.mkdtemp(prefix="vft-bench-")
+    file_sink = lambda: VideoFileSink(os.path.join(tmp_dir, "bench.avi"), SCREEN_WIDTH, SCREEN_HEIGHT, fourcc="MJPG")
+    cases = [
+        ("off", None),
+        ("file", lambda: [file_sink()]),
+        ("slow", lambda: [_SlowSink(0.1)]),
+        ("file+slow", lambda: [file_sink(), _SlowSink(0.1)]),
+    ]
+    print(f"{'recording':<22}{'mean ms':>10}{'p99 ms':>10}{'max depth':>11}{'written':>9}{'dropped':>9}")
+    for name, make_sinks in cases:
+        recorder = SessionRecorder(make_sinks()) if make_sinks else None
+        if recorder:
+            recorder.start()
+        times, max_depth = [], 0
+        deadline = time.perf_counter()
+        for raw in frames:
+            t0 = time.perf_counter()
+            frame = _pooled_frame(renderer, raw, buffers)
+            if recorder:
+                recorder.submit(frame, t0)
+                max_depth = max(max_depth, recorder.queue_depth)
+            times.append((time.perf_counter() - t0) * 1000.0)
+            deadline += 1.0 / FPS
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+        p99 = sorted(times)[int(len(times) * 0.99) - 1]
+        sinks = {"-": {"written": 0, "dropped": 0}}
+        if recorder:
+            recorder.stop()
+            sinks = recorder.stats()["sinks"]
+        for path, sink in sinks.items():
+            label = name if len(sinks) == 1 else f"{name} [{os.path.basename(path)}]"
+            print(f"{label:<22}{statistics.mean(times):>10.3f}{p99:>10.3f}{max_depth:>11}"
+                  f"{sink['written']:>9}{sink['dropped']:>9}")
+
+def _timed_query(fn, repeat: int = 50) -> float:
+    """Rata-rata waktu query dalam milidetik."""
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) * 1000.0 / repeat
+
+def bench_store(n_shots: int, n_players: int):
+    """
+    Mengisi ScoreStore dengan jutaan tembakan lewat jalur yang sama dengan main loop, lalu mengukur:
+    - biaya log_shot di main loop (hanya enqueue)
+    - throughput thread writer
+    - latensi query leaderboard & agregat akurasi per pemain
+    """
+    path = os.path.join(tempfile.mkdtemp(prefix="vft-bench-"), "bench.db")
+    store = ScoreStore(path)
+    store.start()
+    rng = random.Random(0)
+    shots_per_session = 40
+    calls = []
+    t_start = time.perf_counter()
+    for i in range(0, n_shots, shots_per_session):
+        player = f"player{rng.randrange(n_players)}"
+        t = 1.7e9 + i
+        session_id = store.begin_session(player, t)
+        score = 0
+        for j in range(shots_per_session):
+            target = rng.randint(40, 95)
+            level = rng.uniform(0, 100)
+            accuracy = max(0.0, 100.0 - abs(target - level))
+            result = "score" if accuracy >= 75 and rng.random() < 0.8 else "miss"
+            score += result == "score"
+            t0 = time.perf_counter()
+            store.log_shot(session_id, player, target, level, accuracy, result, t + j, t + j + 1.0)
+            calls.append(time.perf_counter() - t0)
+        store.end_session(session_id, player, score, shots_per_session - score, t + shots_per_session)
+    t_enqueued = time.perf_counter()
+    store.flush()
+    t_done = time.perf_counter()
+    calls.sort()
+    print(f"shots: {n_shots}  players: {n_players}  batches: {store.batches}")
+    print(f"log_shot (main loop)   mean {statistics.mean(calls) * 1e6:.2f} us  p99 {calls[int(len(calls) * 0.99)] * 1e6:.2f} us")
+    print(f"enqueue total          {t_enqueued - t_start:.2f} s")
+    print(f"ingest total           {t_done - t_start:.2f} s  ({n_shots / (t_done - t_start):,.0f} shots/s)")
+    reader = store._reader
+    queries = [
+        ("top_sessions(10)", lambda: store.top_sessions(10)),
+        ("top_players(10)", lambda: store.top_players(10)),
+        ("player_accuracy", lambda: store.player_accuracy("player0")),
+        ("GROUP BY shots (ref)", lambda: reader.execute(
+            "SELECT COUNT(*), AVG(accuracy) FROM shots WHERE player = ?", ("player0",)).fetchone()),
+    ]
+    for name, fn in queries:
+        print(f"{name:<22} {_timed_query(fn, repeat=5 if 'ref' in name else 200):.3f} ms")
+    store.close()
+
+def _read_video(path: str, n: int):
+    """Membaca maksimal n frame dari video rekaman, diubah ke ukuran kamera game."""
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < n:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, (CAMERA_WIDTH, CAMERA_HEIGHT)))
+    cap.release()
+    if not frames:
+        raise SystemExit(f"✗ cannot read video: {path}")
+    return frames
+
+def bench_tracker(video: str, n: int):
+    """
+    Biaya hand tracking per frame pada video dua tangan (hanya valid jika kolom
+    hands/frame mendekati jumlah slot, karena landmark model dijalankan per tangan):
+    - 1 pemain  : HandTracker(1), satu inferensi
+    - 2 pemain  : HandTracker(2), satu inferensi untuk kedua slot (jalur game)
+    - 2x naive  : dua HandTracker(1) pada potongan kiri/kanan (satu inferensi per pemain, pembanding)
+    """
+    from hand_tracker import HandTracker
+    frames = _read_video(video, n)
+    buffers = FrameBufferPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+    buffers.bind_camera(frames[0].shape)
+    single, multi = HandTracker(1), HandTracker(2)
+    naive = [HandTracker(1), HandTracker(1)]
+    half = CAMERA_WIDTH // 2
+
+    def run_naive(raw):
+        hand = enhance_frame(raw, out=buffers.hand, work=buffers.work)
+        return [naive[0].process(hand[:, :half]), naive[1].process(hand[:, half:])]
+
+    def counted(step, trackers):
+        """Membungkus step agar jumlah tangan terdeteksi per frame ikut dihitung."""
+        counts = []
+
+        def run(raw):
+            step(raw)
+            counts.append(sum(x is not None for t in trackers for x in t._slot_x))
+        return run, counts
+
+    cases = [
+        ("1 player", lambda raw: single.process_players(enhance_frame(raw, out=buffers.hand, work=buffers.work), rgb=buffers.rgb), [single]),
+        ("2 players", lambda raw: multi.process_players(enhance_frame(raw, out=buffers.hand, work=buffers.work), rgb=buffers.rgb), [multi]),
+        ("2x naive", run_naive, naive),
+    ]
+    print(f"{'tracker':<12}{'mean ms':>10}{'p99 ms':>10}{'hands/frame':>13}")
+    for name, step, trackers in cases:
+        run, counts = counted(step, trackers)
+        times, _ = _profile(run, frames, alloc=False)
+        p99 = sorted(times)[int(len(times) * 0.99) - 1]
+        hands = statistics.mean(counts)
+        expected = sum(t.num_players for t in trackers)
+        print(f"{name:<12}{statistics.mean(times):>10.3f}{p99:>10.3f}{hands:>13.2f}")
+        if hands < 0.9 * expected:
+            # landmark model dijalankan per tangan terdeteksi; tanpa tangan hanya palm detection yang terukur
+            print(f"  ⚠️ {name}: rata-rata {hands:.2f} dari {expected} tangan per frame, biaya landmark per tangan "
+                  f"belum terukur penuh (hasil ini tidak membuktikan biaya dua pemain)")
+
+def bench_scheduler(seconds: float, num_players: int):
+    """
+    Menjalankan game headless (ScriptedInput) di scheduler multi-rate dan mencetak
+    deadline miss per task: pemain bergantian menembak dengan level suara acak.
+    """
+    from vft import VoiceFreeThrow
+    from scripted_input import ScriptedInput
+    rng = random.Random(0)
+    events = [{"t": 0.1, "key": "space"}]
+    t = 0.5
+    while t < seconds:
+        events.append({"t": t, "level": rng.uniform(30, 100)})
+        events.append({"t": t + 0.1, "shoot": rng.randrange(num_players)})
+        t += 0.7
+    events.append({"t": seconds, "key": "q"})
+    db_path = os.path.join(tempfile.mkdtemp(prefix="vft-bench-"), "bench.db")
+    game = VoiceFreeThrow(num_players=num_players, db_path=db_path, script=ScriptedInput(events, num_players))
+    game.run()
+
+def bench_render(n: int):
+    """Frame time renderer pada skala render internal 0.5x, 0.75x, dan 1x untuk output 720p dan 1080p."""
+    print(f"{'output':<8}{'scale':>7}{'crisp':>7}{'mean ms':>10}{'p99 ms':>10}")
+    for out_w, out_h in ((1280, 720), (1920, 1080)):
+        view = np.zeros((out_h, out_w, 3), dtype=np.uint8)
+        for scale in (0.5, 0.75, 1.0):
+            for crisp in ((False, True) if scale != 1.0 else (False,)):
+                renderer = GameRenderer(out_w, out_h, scale=scale, crisp_text=crisp)
+                ball = Ball(renderer.release_x, renderer.release_y, renderer.basket_x, renderer.basket_y, 90.0, 90.0,
+                            bounds=(out_w, out_h), unit=renderer.unit)
+                for _ in range(10):
+                    ball.update(1.0 / FPS, renderer.basket_x, renderer.basket_y, renderer.basket_rim_radius)
+
+                def step(_):
+                    target = renderer.begin(view)
+                    renderer.draw_background(target)
+                    renderer.draw_basket(target)
+                    renderer.draw_player(target, hand_ready=False)
+                    ball.draw(target, renderer.scale)
+                    renderer.draw_accuracy_bar(target, 70, 65.0)
+                    renderer.draw_hand_status(target, hand_ready=False, shooting=True)
+                    renderer.draw_shot_result(target, 88.0, "score", time.time())
+                    renderer.draw_controls_panel(target, 42.0, 3, 1, 5)
+                    renderer.present(view)
+
+                times, _ = _profile(step, range(n), alloc=False)
+                p99 = sorted(times)[int(len(times) * 0.99) - 1]
+                print(f"{out_h:<8}{scale:>7.2f}{str(crisp):>7}{statistics.mean(times):>10.3f}{p99:>10.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark headless Voice Free Throw")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p = sub.add_parser("frames", help="alokasi & jitter pipeline frame (buffer pool)")
+    p.add_argument("--frames", type=int, default=300)
+    p = sub.add_parser("record", help="frame time game loop dengan rekaman aktif")
+    p.add_argument("--frames", type=int, default=300)
+    p = sub.add_parser("store", help="ingest & query ScoreStore dengan jutaan tembakan")
+    p.add_argument("--shots", type=int, default=1_000_000)
+    p.add_argument("--players", type=int, default=1000)
+    p = sub.add_parser("tracker", help="biaya hand tracking 1 vs 2 pemain pada video rekaman")
+    p.add_argument("--video", required=True)
+    p.add_argument("--frames", type=int, default=300)
+    p = sub.add_parser("scheduler", help="deadline miss per task pada game headless")
+    p.add_argument("--seconds", type=float, default=10.0)
+    p.add_argument("--players", type=int, default=1)
+    p = sub.add_parser("render", help="frame time renderer per skala render internal")
+    p.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    if args.bench == "frames":
+        bench_frames(args.frames)
+    elif args.bench == "record":
+        bench_record(args.frames)
+    elif args.bench == "store":
+        bench_store(args.shots, args.players)
+    elif args.bench == "tracker":
+        bench_tracker(args.video, args.frames)
+    elif args.bench == "scheduler":
+        bench_scheduler(args.seconds, args.players)
+    elif args.bench == "render":
+        bench_render(args.frames)
+
+if __name__ == "__main__":
+    main()
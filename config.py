@@ -37,4 +37,44 @@ SFX_BEST = os.path.join(ASSET_DIR, "best.wav")
 
 # Batas frekuensi untuk bandpass filter audio
 BAND_LOW = 300.0
-BAND_HIGH = 3000.0
\ No newline at end of file
+BAND_HIGH = 3000.0
+
+# Config kamera dan preview tangan
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 480
+PREVIEW_WIDTH = 220
+PREVIEW_HEIGHT = 165
+PREVIEW_MARGIN = 20
+
+# Config rekaman sesi / output spectator
+RECORD_FPS = 30
+RECORD_FOURCC = "mp4v"
+RECORD_QUEUE_SIZE = 8
+# interval (detik) log status rekaman (kedalaman antrian, frame ditulis/dibuang) selama game
+RECORD_STATS_INTERVAL = 5.0
+
+# Penyimpanan sesi, tembakan, dan leaderboard (SQLite)
+DB_FILE = os.path.join(os.path.dirname(__file__), "vft_scores.db")
+DEFAULT_PLAYER = "player"
+STORE_BATCH_SIZE = 500
+STORE_FLUSH_INTERVAL = 0.5
+
+# Mode multi-pemain (split-screen, satu kamera & mikrofon)
+MAX_PLAYERS = 2
+# margin hysteresis (fraksi lebar frame) sebelum tangan berpindah slot pemain
+HAND_SLOT_MARGIN = 0.08
+
+# Scheduler multi-rate (Hz per task)
+CAMERA_FPS = 30
+PHYSICS_HZ = 120
+# maksimal langkah fisika per tick scheduler saat mengejar waktu yang tertinggal (sisanya dibuang)
+PHYSICS_MAX_STEPS = 4
+HUD_HZ = 1
+AUDIO_POLL_HZ = 30
+
+# Resolusi render internal: geometri mengikuti layout referensi 720p, digambar pada
+# RENDER_SCALE x resolusi output lalu di-upscale sekali; teks digambar native jika CRISP_TEXT.
+# Skala < 1.0 saat ini lebih lambat dari 1.0 (biaya upscale > biaya render 1x, lihat benchmark.py render)
+REF_HEIGHT = 720
+RENDER_SCALE = 1.0
+CRISP_TEXT = True
@@ -0,0 +1,39 @@
+from typing import Optional, Tuple
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, PREVIEW_WIDTH, PREVIEW_HEIGHT, PREVIEW_MARGIN
+
+class FrameBufferPool:
+    """
+    Pool buffer frame yang dipakai ulang setiap iterasi main loop:
+    - frame output (SCREEN_HEIGHT x SCREEN_WIDTH x 3)
+    - buffer kamera mentah, buffer kerja enhance_frame, dan hasil enhance
+    - buffer RGB untuk MediaPipe
+    - region preview sebagai view langsung ke frame output (tanpa copy)
+    Semua fungsi OpenCV menulis lewat parameter dst= ke buffer-buffer ini.
+    """
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        # region preview: view ke frame output, cv2.resize menulis langsung ke sini
+        x2, y2 = width - PREVIEW_MARGIN, height - PREVIEW_MARGIN
+        x1, y1 = x2 - PREVIEW_WIDTH, y2 - PREVIEW_HEIGHT
+        self.preview_rect: Tuple[Tuple[int, int], Tuple[int, int]] = ((x1, y1), (x2, y2))
+        self.preview = self.frame[y1:y2, x1:x2]
+        # hasil resize preview terakhir dari task tracking, disalin ke region preview saat render
+        self.preview_src = np.zeros((PREVIEW_HEIGHT, PREVIEW_WIDTH, 3), dtype=np.uint8)
+        self.camera_shape: Optional[Tuple[int, ...]] = None
+        self.raw: Optional[np.ndarray] = None
+        self.work: Optional[np.ndarray] = None
+        self.hand: Optional[np.ndarray] = None
+        self.rgb: Optional[np.ndarray] = None
+
+    def bind_camera(self, shape: Tuple[int, ...]):
+        """Mengalokasikan buffer kamera hanya jika ukuran frame kamera berubah."""
+        if shape == self.camera_shape:
+            return
+        self.camera_shape = tuple(shape)
+        self.raw = np.empty(shape, dtype=np.uint8)
+        self.work = np.empty(shape, dtype=np.uint8)
+        self.hand = np.empty(shape, dtype=np.uint8)
+        self.rgb = np.empty(shape, dtype=np.uint8)
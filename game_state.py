@@ -2,7 +2,7 @@ import random
 import time
 from dataclasses import dataclass, field
 from typing import Optional
-from config import GAME_DURATION
+from config import GAME_DURATION, DEFAULT_PLAYER
 from ball import Ball
 
 # Inisialisasi state game
@@ -18,7 +18,14 @@ class GameState:
     game_over: bool = False
     start_time: float = 0.0
     remaining_time: float = GAME_DURATION
+    hud_time: float = GAME_DURATION  # teks timer HUD, diperbarui sekali per detik
     last_shot_accuracy: Optional[float] = None
     shot_result: Optional[str] = None
     result_display_time: float = 0.0
+    # data sesi & tembakan untuk ScoreStore
+    player: str = DEFAULT_PLAYER
+    session_id: Optional[str] = None
+    session_open: bool = False  # sesi belum ditutup di ScoreStore (termasuk menunggu bola terakhir)
+    shot_time: float = 0.0
+    shot_audio_level: float = 0.0
 
@@ -1,53 +1,117 @@
+from itertools import combinations
+from typing import List, Optional
 import cv2
 import mediapipe as mp
 import numpy as np
+from config import HAND_SLOT_MARGIN
 
-class HandTracker:
-    """Menggunakan Mediapipe Hands untuk deteksi gesture open–close sebagai trigger tembakan."""
+class GestureState:
+    """State machine gesture open→close→open untuk satu slot pemain."""
     def __init__(self):
+        self.last_open = False
+        self.last_closed = False
+
+    def reset(self):
+        self.last_open = False
+        self.last_closed = False
+
+    def update(self, is_open: bool, is_closed: bool) -> bool:
+        """Mengembalikan True (shoot) saat tangan kembali terbuka setelah mengepal."""
+        shoot = is_open and not self.last_open and self.last_closed
+        self.last_open = is_open
+        self.last_closed = is_closed
+        return shoot
+
+
+class HandTracker:
+    """
+    Menggunakan Mediapipe Hands untuk deteksi gesture open–close sebagai trigger tembakan.
+    Mendukung beberapa pemain: Mediapipe dijalankan sekali per frame untuk maksimal
+    `num_players` tangan, lalu setiap tangan dipetakan ke slot pemain berdasarkan posisi
+    horizontal dari sudut pandang pemain (frame dibagi menjadi kolom sama lebar, kiri kiosk → slot 0).
+    """
+    def __init__(self, num_players: int = 1):
+        self.num_players = num_players
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(max_num_hands=1,
+        self.hands = self.mp_hands.Hands(max_num_hands=num_players,
                                          min_detection_confidence=0.7,
                                          min_tracking_confidence=0.5)
         self.mp_draw = mp.solutions.drawing_utils
-        self._last_open = False
-        self._last_closed = False
+        self.gestures = [GestureState() for _ in range(num_players)]
+        # posisi x (sudah di-mirror) tangan per slot pada frame sebelumnya
+        self._slot_x: List[Optional[float]] = [None] * num_players
 
-    def process(self, frame: np.ndarray) -> bool:
+    def process(self, frame: np.ndarray, rgb: Optional[np.ndarray] = None) -> bool:
+        """Versi satu pemain dari process_players (slot 0)."""
+        return self.process_players(frame, rgb)[0]
+
+    def process_players(self, frame: np.ndarray, rgb: Optional[np.ndarray] = None) -> List[bool]:
         """
-        - Memproses frame untuk deteksi tangan
-        - Menggambar landmark
-        - Mendapatkan bounding box
-        - Mendeteksi transisi gesture open→close→open untuk dianggap 'shoot'
+        - Memproses frame untuk deteksi tangan (konversi RGB ditulis ke `rgb` jika diberikan)
+        - Satu inferensi Mediapipe untuk semua pemain
+        - Memetakan tangan ke slot pemain berdasarkan posisi
+        - Menggambar landmark dan bounding box
+        - Mendeteksi transisi gesture open→close→open per slot untuk dianggap 'shoot'
         """
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
         results = self.hands.process(rgb)
 
-        if not results.multi_hand_landmarks:
-            self._last_open = False
-            self._last_closed = False
-            return False
-
-        landmarks = results.multi_hand_landmarks[0]
-        self.mp_draw.draw_landmarks(frame, landmarks, self.mp_hands.HAND_CONNECTIONS)
-
+        shoots = [False] * self.num_players
+        slots = self._assign_slots(results.multi_hand_landmarks or [])
         h, w, _ = frame.shape
-        xs = [lm.x for lm in landmarks.landmark]
-        ys = [lm.y for lm in landmarks.landmark]
-        x1, x2 = int(min(xs) * w), int(max(xs) * w)
-        y1, y2 = int(min(ys) * h), int(max(ys) * h)
-        cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-
-        is_open = self._is_hand_open(landmarks.landmark)
-        is_closed = self._is_hand_closed(landmarks.landmark)
+        for slot, gesture in enumerate(self.gestures):
+            landmarks = slots[slot]
+            if landmarks is None:
+                gesture.reset()
+                continue
+            self.mp_draw.draw_landmarks(frame, landmarks, self.mp_hands.HAND_CONNECTIONS)
+            xs = [lm.x for lm in landmarks.landmark]
+            ys = [lm.y for lm in landmarks.landmark]
+            x1, x2 = int(min(xs) * w), int(max(xs) * w)
+            y1, y2 = int(min(ys) * h), int(max(ys) * h)
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            if self.num_players > 1:
+                cv2.putText(frame, f"P{slot + 1}", (x1, max(0, y1 - 8)), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
 
-        shoot = False
-        if is_open and not self._last_open and self._last_closed:
-            shoot = True
+            is_open = self._is_hand_open(landmarks.landmark)
+            is_closed = self._is_hand_closed(landmarks.landmark)
+            shoots[slot] = gesture.update(is_open, is_closed)
+        return shoots
 
-        self._last_open = is_open
-        self._last_closed = is_closed
-        return shoot
+    def _assign_slots(self, hands) -> list:
+        """
+        Memetakan tangan ke slot sebagai satu assignment global berdasarkan posisi pergelangan (landmark 0).
+        Frame kamera tidak di-mirror, sehingga x dibalik (1 - x): pemain yang berdiri di
+        kiri kiosk menjadi slot 0 (P1, viewport kiri).
+        Tangan diurutkan dari kiri ke kanan dan setiap tangan selalu mendapat slot sendiri
+        (urutan kiri→kanan dipertahankan). Dari semua pilihan slot, dipilih yang jarak total
+        tangan ke kolom slot-nya paling kecil; kolom slot yang terisi pada frame sebelumnya
+        diperlebar HAND_SLOT_MARGIN. Hysteresis hanya memecah seri (jarak ke posisi slot
+        sebelumnya), sehingga satu tangan di garis tengah tidak berpindah-pindah slot tanpa
+        pernah membuang tangan lain selama masih ada slot kosong.
+        """
+        n = self.num_players
+        # Mediapipe mengembalikan maksimal num_players tangan (max_num_hands)
+        hands = list(hands)[:n]
+        wrist_x = [min(max(1.0 - landmarks.landmark[0].x, 0.0), 0.999) for landmarks in hands]
+        placed = sorted(zip(wrist_x, hands), key=lambda item: item[0])
+        best, best_cost = (), None
+        for chosen in combinations(range(n), len(placed)):
+            outside = tie = 0.0
+            for (x, _), slot in zip(placed, chosen):
+                prev = self._slot_x[slot]
+                margin = HAND_SLOT_MARGIN if prev is not None else 0.0
+                outside += max(0.0, slot / n - margin - x, x - (slot + 1) / n - margin)
+                tie += abs(x - (prev if prev is not None else (slot + 0.5) / n))
+            if best_cost is None or (outside, tie) < best_cost:
+                best, best_cost = chosen, (outside, tie)
+        slots = [None] * n
+        slot_x: List[Optional[float]] = [None] * n
+        for (x, landmarks), slot in zip(placed, best):
+            slots[slot] = landmarks
+            slot_x[slot] = x
+        self._slot_x = slot_x
+        return slots
 
     @staticmethod
     def _is_hand_open(landmarks) -> bool:
@@ -1,29 +1,33 @@
-from typing import Tuple
+from typing import Optional, Tuple
 import cv2
 import numpy as np
 
-def enhance_frame(frame: np.ndarray) -> np.ndarray:
+# kernel sharpen dibuat sekali, bukan setiap frame
+SHARPEN_KERNEL = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=np.float32)
+
+def enhance_frame(frame: np.ndarray, out: Optional[np.ndarray] = None, work: Optional[np.ndarray] = None) -> np.ndarray:
     """Meningkatkan frame kamera untuk pelacakan tangan yang lebih baik:
     1. Mengurangi noise dengan Gaussian Blur
     2. Unsharp Mask / Sharpen
     3. Contrast & Brightness Tweak
     4. Auto-White-Balance (Gray World Approximation)
+    Jika `out` dan `work` diberikan (buffer dari FrameBufferPool), semua langkah
+    ditulis ke buffer tersebut sehingga tidak ada alokasi frame baru.
+    Frame input tidak diubah.
     """
     # noise reduction
-    frame = cv2.GaussianBlur(frame, (3, 3), 0)
+    work = cv2.GaussianBlur(frame, (3, 3), 0, dst=work)
     # unsharp mask / sharpen
-    kernel = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]])
-    frame = cv2.filter2D(frame, -1, kernel)
+    out = cv2.filter2D(work, -1, SHARPEN_KERNEL, dst=out)
     # contrast & brightness tweak
-    frame = cv2.convertScaleAbs(frame, alpha=1.12, beta=8)
+    cv2.convertScaleAbs(out, dst=out, alpha=1.12, beta=8)
     # simple auto-white-balance (gray-world approximation)
     try:
-        b, g, r = cv2.split(frame.astype(np.float32))
-        avg = (np.mean(b) + np.mean(g) + np.mean(r)) / 3.0
-        b = np.clip(b * (avg / (np.mean(b) + 1e-6)), 0, 255)
-        g = np.clip(g * (avg / (np.mean(g) + 1e-6)), 0, 255)
-        r = np.clip(r * (avg / (np.mean(r) + 1e-6)), 0, 255)
-        frame = cv2.merge([b, g, r]).astype(np.uint8)
+        mean_b, mean_g, mean_r, _ = cv2.mean(out)
+        avg = (mean_b + mean_g + mean_r) / 3.0
+        gains = (avg / (mean_b + 1e-6), avg / (mean_g + 1e-6), avg / (mean_r + 1e-6), 0.0)
+        # cv2.multiply melakukan saturasi 0..255 sehingga tidak perlu clip float
+        cv2.multiply(out, gains, dst=out)
     except Exception:
         pass
-    return frame
+    return out
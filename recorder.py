@@ -0,0 +1,255 @@
+import errno
+import os
+import stat
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+import cv2
+import numpy as np
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, RECORD_FPS, RECORD_FOURCC, RECORD_QUEUE_SIZE
+
+class VideoFileSink:
+    """Encoder file video menggunakan cv2.VideoWriter (mp4/avi)."""
+    def __init__(self, path: str, width: int, height: int, fps: float = RECORD_FPS, fourcc: str = RECORD_FOURCC):
+        self.path = path
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, (width, height))
+        if not self.writer.isOpened():
+            raise IOError(f"cannot open video writer: {path}")
+
+    def write(self, frame: np.ndarray):
+        self.writer.write(frame)
+
+    def release(self):
+        self.writer.release()
+
+
+class PipeSink:
+    """
+    Menulis frame BGR mentah ke named pipe (FIFO) untuk tool streaming lokal, contoh:
+    ffmpeg -f rawvideo -pix_fmt bgr24 -s 1280x720 -r 30 -i <pipe> ...
+    Pipe dibuka non-blocking: selama belum ada pembaca, frame dilewati; saat pipe penuh,
+    write menunggu dengan polling sehingga bisa dibatalkan lewat cancel() dari thread lain.
+    """
+    def __init__(self, path: str, poll_interval: float = 0.005):
+        self.path = path
+        self.poll_interval = poll_interval
+        if not os.path.exists(path):
+            os.mkfifo(path)
+        elif not stat.S_ISFIFO(os.stat(path).st_mode):
+            raise IOError(f"not a named pipe: {path}")
+        self._fd: Optional[int] = None
+        self._cancel = threading.Event()
+        self.skipped = 0
+
+    def _open(self) -> bool:
+        try:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+            return True
+        except OSError as e:
+            if e.errno == errno.ENXIO:  # belum ada pembaca
+                return False
+            raise
+
+    def write(self, frame: np.ndarray):
+        if self._fd is None and not self._open():
+            self.skipped += 1
+            return
+        data = memoryview(frame).cast("B")
+        while data and not self._cancel.is_set():
+            try:
+                data = data[os.write(self._fd, data):]
+            except BlockingIOError:
+                time.sleep(self.poll_interval)
+            except BrokenPipeError:
+                # pembaca terputus: tutup dan tunggu pembaca baru
+                self.release()
+                return
+
+    def cancel(self):
+        """Membatalkan write yang sedang menunggu pipe (dipanggil dari thread lain)."""
+        self._cancel.set()
+
+    def release(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except Exception:
+                pass
+            self._fd = None
+
+
+def open_sink(path: str, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT, fps: float = RECORD_FPS):
+    """Memilih sink berdasarkan path: named pipe → PipeSink, selain itu → VideoFileSink."""
+    if os.path.exists(path) and stat.S_ISFIFO(os.stat(path).st_mode):
+        return PipeSink(path)
+    return VideoFileSink(path, width, height, fps)
+
+
+class _SinkWorker:
+    """Antrian slot dan thread encoder milik satu sink, agar sink yang lambat tidak menahan sink lain."""
+    def __init__(self, sink):
+        self.sink = sink
+        self.pending: Deque[int] = deque()
+        self.thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = False
+
+    @property
+    def path(self) -> str:
+        return getattr(self.sink, "path", str(self.sink))
+
+
+class SessionRecorder:
+    """
+    Tahap output opsional untuk merekam / streaming frame game tanpa membebani main loop:
+    1. Frame hasil render disalin ke slot dari pool buffer berukuran tetap (tanpa alokasi;
+       satu memcpy per frame rekaman, lihat submit())
+    2. Index slot dimasukkan ke antrian setiap sink; tiap sink punya thread encoder sendiri,
+       sehingga pembaca pipe yang lambat tidak membuat rekaman file ikut membuang frame
+    3. Jika encoder sebuah sink tertinggal, frame tertua di antrian sink itu dibuang (drop-oldest),
+       game tidak pernah menunggu; slot kembali ke pool setelah semua sink selesai memakainya
+    4. Menyediakan kedalaman antrian dan jumlah frame yang dibuang per sink
+    """
+    def __init__(self, sinks: List, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT,
+                 fps: float = RECORD_FPS, queue_size: int = RECORD_QUEUE_SIZE):
+        self.sinks = sinks
+        self.fps = fps
+        self.queue_size = queue_size
+        self._workers = [_SinkWorker(sink) for sink in sinks]
+        # tiap sink memegang paling banyak queue_size slot (antrian + frame yang sedang di-encode)
+        # setelah drop-oldest, jadi satu slot ekstra menjamin submit selalu mendapat slot bebas
+        self._slots = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(len(sinks) * queue_size + 1)]
+        self._refs = [0] * len(self._slots)
+        self._free: Deque[int] = deque(range(len(self._slots)))
+        self._cond = threading.Condition()
+        self._next_submit: Optional[float] = None
+        self.running = False
+        self._abandon = False
+        self.submitted = 0
+        self.skipped = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Kedalaman antrian sink yang paling tertinggal."""
+        return max((len(w.pending) for w in self._workers), default=0)
+
+    def start(self):
+        """Memulai satu thread encoder per sink."""
+        self.running = True
+        for worker in self._workers:
+            worker.thread = threading.Thread(target=self._encode_loop, args=(worker,), daemon=True)
+            worker.thread.start()
+        print(f"✓ Recording started ({len(self.sinks)} output)")
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Menunggu antrian habis, menghentikan thread encoder, dan menutup semua sink.
+        Jika thread belum selesai dalam `timeout`, sisa antrian dibatalkan; sink hanya
+        ditutup setelah thread-nya benar-benar berhenti (tidak pernah saat write sedang berjalan).
+        """
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            if worker.thread:
+                worker.thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        stalled = [w for w in self._workers if w.thread and w.thread.is_alive()]
+        if stalled:
+            with self._cond:
+                self._abandon = True
+            for worker in stalled:
+                if hasattr(worker.sink, "cancel"):
+                    worker.sink.cancel()
+                worker.thread.join(timeout=timeout)
+        for worker in self._workers:
+            if worker.thread and worker.thread.is_alive():
+                print(f"✗ recorder encoder did not stop; output left open ({worker.path})")
+                continue
+            try:
+                worker.sink.release()
+            except Exception:
+                pass
+
+    def submit(self, frame: np.ndarray, now: float) -> bool:
+        """
+        Dipanggil dari main loop setelah render. Frame hanya disalin ke slot pool
+        (memcpy, tanpa alokasi); encoding dilakukan di thread encoder tiap sink.
+        Salinan ini disengaja: game merender ke FrameBufferPool.frame yang juga menjadi
+        sumber view viewport dan preview, jadi frame tidak diserahkan by reference. Satu
+        memcpy 1280x720 (~0.1 ms) jauh lebih murah daripada membuat ulang view tersebut
+        ke slot yang berganti setiap frame.
+        Frame diambil mengikuti jadwal tetap RECORD_FPS (bukan jarak dari frame terakhir),
+        sehingga jitter render tidak mengurangi jumlah frame rekaman; frame di antara jadwal dilewati.
+        """
+        if not self.running:
+            return False
+        period = 1.0 / self.fps
+        if self._next_submit is None:
+            self._next_submit = now
+        if now < self._next_submit:
+            self.skipped += 1
+            return False
+        self._next_submit += period
+        if self._next_submit <= now:
+            # tertinggal lebih dari satu periode (render tersendat): sinkron ulang ke waktu sekarang
+            self._next_submit = now + period
+        with self._cond:
+            workers = [w for w in self._workers if not w.failed]
+            if not workers:
+                return False
+            for worker in workers:
+                if len(worker.pending) >= self.queue_size:
+                    # encoder sink ini tertinggal: buang frame tertua di antriannya
+                    self._release(worker.pending.popleft())
+                    worker.dropped += 1
+            slot = self._free.popleft()
+        np.copyto(self._slots[slot], frame)
+        with self._cond:
+            for worker in workers:
+                worker.pending.append(slot)
+                self._refs[slot] += 1
+            self.submitted += 1
+            self._cond.notify_all()
+        return True
+
+    def _release(self, slot: int):
+        """Melepas satu referensi slot (dipanggil dengan _cond terkunci); slot bebas jika tidak dipakai sink lain."""
+        self._refs[slot] -= 1
+        if self._refs[slot] == 0:
+            self._free.append(slot)
+
+    def _encode_loop(self, worker: _SinkWorker):
+        """Thread encoder satu sink: mengambil slot tertua dari antriannya, menulis, lalu melepas slot."""
+        while True:
+            with self._cond:
+                while self.running and not worker.pending:
+                    self._cond.wait()
+                if self._abandon or not worker.pending:
+                    return
+                slot = worker.pending.popleft()
+            try:
+                worker.sink.write(self._slots[slot])
+            except Exception as e:
+                print(f"✗ recorder sink error ({worker.path}):", e)
+                worker.failed = True
+            with self._cond:
+                self._release(slot)
+                if worker.failed:
+                    while worker.pending:
+                        self._release(worker.pending.popleft())
+                    return
+                worker.written += 1
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "submitted": self.submitted,
+            "skipped": self.skipped,
+            "sinks": {
+                w.path: {"queue_depth": len(w.pending), "written": w.written, "dropped": w.dropped, "failed": w.failed}
+                for w in self._workers
+            },
+        }
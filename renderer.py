@@ -1,59 +1,125 @@
 import cv2
 import numpy as np
 import time
-from config import COLOR_SKY, COLOR_GROUND, COLOR_POLE, COLOR_BACKBOARD, COLOR_RIM, COLOR_NET, COLOR_PLAYER_BODY, COLOR_PLAYER_SHIRT
+from typing import List, Optional, Tuple
+from config import COLOR_SKY, COLOR_GROUND, COLOR_POLE, COLOR_BACKBOARD, COLOR_RIM, COLOR_NET, COLOR_PLAYER_BODY, COLOR_PLAYER_SHIRT, REF_HEIGHT
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
 
 class GameRenderer:
-    """Renderer utama untuk latar, ring, pemain, UI, dan indikator akurasi suara."""    
-    def __init__(self, width: int, height: int):    
+    """
+    Renderer utama untuk latar, ring, pemain, UI, dan indikator akurasi suara.
+    Geometri dihitung dalam koordinat dunia (= piksel viewport output) dari posisi relatif
+    terhadap layout referensi 720p, sehingga ukuran objek ikut resolusi output.
+    Dengan `scale` < 1.0, semua primitif digambar ke canvas internal yang lebih kecil lalu
+    di-upscale sekali saat present(); teks bisa digambar tajam di resolusi native (crisp_text).
+    """
+    def __init__(self, width: int, height: int, scale: float = 1.0, crisp_text: bool = True):
+        if not 0.0 < scale <= 1.0:
+            raise ValueError(f"render scale must be in (0, 1], got {scale}")
         self.width = width
         self.height = height
-        self.ground_y = height - 120
-        self.player_x = int(width * 0.15)
-        self.player_y = self.ground_y - 120
+        self.unit = height / REF_HEIGHT  # 1 piksel layout referensi dalam koordinat dunia
+        self.scale = scale
+        self.crisp_text = crisp_text and scale != 1.0
+        u = self.unit
+        self.ground_y = height - int(120 * u)
+        # minimal 170px (referensi) agar pemain tidak tertutup accuracy bar pada viewport split-screen
+        self.player_x = max(int(width * 0.15), int(170 * u))
+        self.player_y = self.ground_y - int(120 * u)
+        self.release_x = self.player_x + 30 * u
+        self.release_y = self.player_y - 20 * u
         self.basket_x = int(width * 0.70)
         self.basket_y = int(height * 0.35)
-        self.basket_rim_radius = 50
+        self.basket_rim_radius = int(50 * u)
+        # canvas internal hanya dipakai jika scale != 1.0; pada 1.0 primitif digambar langsung ke output
+        self.canvas: Optional[np.ndarray] = None
+        if scale != 1.0:
+            self.canvas = np.zeros((max(1, round(height * scale)), max(1, round(width * scale)), 3), dtype=np.uint8)
+        self._texts: List[Tuple[str, Tuple[int, int], float, Tuple[int, int, int], int]] = []
+
+    # --- konversi koordinat ---
+
+    def _p(self, x: float, y: float) -> Tuple[int, int]:
+        """Koordinat dunia → koordinat canvas."""
+        return int(x * self.scale), int(y * self.scale)
+
+    def _t(self, thickness: int) -> int:
+        """Ketebalan garis referensi → canvas (-1 tetap berarti fill)."""
+        if thickness < 0:
+            return thickness
+        return max(1, int(round(thickness * self.unit * self.scale)))
+
+    def _text(self, frame: np.ndarray, text: str, x: float, y: float, font_scale: float, color, thickness: int):
+        """putText pada koordinat dunia; jika crisp_text, ditunda dan digambar di resolusi native saat present()."""
+        if self.crisp_text:
+            self._texts.append((text, (int(x), int(y)), font_scale * self.unit, color, max(1, int(round(thickness * self.unit)))))
+        else:
+            cv2.putText(frame, text, self._p(x, y), FONT, font_scale * self.unit * self.scale, color, self._t(thickness))
+
+    def begin(self, view: np.ndarray) -> np.ndarray:
+        """Memulai frame: mengembalikan target gambar (canvas internal, atau view output jika scale 1.0)."""
+        self._texts.clear()
+        return view if self.canvas is None else self.canvas
+
+    def present(self, view: np.ndarray):
+        """Satu pass upscale canvas ke view output, lalu menggambar teks crisp di resolusi native."""
+        if self.canvas is not None:
+            cv2.resize(self.canvas, (self.width, self.height), dst=view, interpolation=cv2.INTER_LINEAR)
+        for text, org, font_scale, color, thickness in self._texts:
+            cv2.putText(view, text, org, FONT, font_scale, color, thickness)
+
+    def _dim(self, frame: np.ndarray, alpha: float):
+        """Blending frame dengan overlay hitam secara in-place (tanpa copy frame overlay)."""
+        cv2.convertScaleAbs(frame, dst=frame, alpha=alpha)
+        # teks crisp yang tertunda ikut diredupkan agar urutan layer tetap sama
+        self._texts = [(text, org, fs, tuple(int(c * alpha) for c in color), th) for text, org, fs, color, th in self._texts]
 
     def draw_background(self, frame: np.ndarray):
         """Menggambar langit, tanah, dan garis-garis lapangan."""
-        cv2.rectangle(frame, (0, 0), (self.width, self.ground_y), COLOR_SKY, -1)
-        cv2.rectangle(frame, (0, self.ground_y), (self.width, self.height), COLOR_GROUND, -1)
-        for x in range(0, self.width, 100):
-            cv2.line(frame, (x, self.ground_y), (x, self.height), (80, 130, 40), 2)
+        cv2.rectangle(frame, self._p(0, 0), self._p(self.width, self.ground_y), COLOR_SKY, -1)
+        cv2.rectangle(frame, self._p(0, self.ground_y), self._p(self.width, self.height), COLOR_GROUND, -1)
+        for x in np.arange(0, self.width, 100 * self.unit):
+            cv2.line(frame, self._p(x, self.ground_y), self._p(x, self.height), (80, 130, 40), self._t(2))
 
     def draw_basket(self, frame: np.ndarray):
         """Menggambar tiang ring, papan, ring, dan jaring."""
-        pole_x = self.basket_x + 60
-        cv2.rectangle(frame, (pole_x - 8, self.basket_y - 80), (pole_x + 8, self.ground_y), COLOR_POLE, -1)
-        cv2.rectangle(frame, (pole_x - 5, self.basket_y - 90), (pole_x + 15, self.basket_y + 40), COLOR_BACKBOARD, -1)
-        cv2.ellipse(frame, (self.basket_x, self.basket_y), (self.basket_rim_radius, 15), 0, 0, 180, COLOR_RIM, 5)
+        u = self.unit
+        bx, by = self.basket_x, self.basket_y
+        pole_x = bx + 60 * u
+        cv2.rectangle(frame, self._p(pole_x - 8 * u, by - 80 * u), self._p(pole_x + 8 * u, self.ground_y), COLOR_POLE, -1)
+        cv2.rectangle(frame, self._p(pole_x - 5 * u, by - 90 * u), self._p(pole_x + 15 * u, by + 40 * u), COLOR_BACKBOARD, -1)
+        cv2.ellipse(frame, self._p(bx, by), self._p(self.basket_rim_radius, 15 * u), 0, 0, 180, COLOR_RIM, self._t(5))
         for i in range(10):
             angle = i * 18
-            x1 = int(self.basket_x + self.basket_rim_radius * np.cos(np.radians(angle)))
-            y1 = self.basket_y
-            x2 = int(self.basket_x + (self.basket_rim_radius - 10) * np.cos(np.radians(angle)))
-            y2 = self.basket_y + 40
-            cv2.line(frame, (x1, y1), (x2, y2), COLOR_NET, 2)
+            x1 = bx + self.basket_rim_radius * np.cos(np.radians(angle))
+            y1 = by
+            x2 = bx + (self.basket_rim_radius - 10 * u) * np.cos(np.radians(angle))
+            y2 = by + 40 * u
+            cv2.line(frame, self._p(x1, y1), self._p(x2, y2), COLOR_NET, self._t(2))
 
     def draw_player(self, frame: np.ndarray, hand_ready: bool):
         """Menggambar pemain dengan animasi tangan siap atau tidak siap menembak."""
+        u = self.unit
         x, y = self.player_x, self.player_y
-        cv2.ellipse(frame, (x, self.ground_y - 5), (35, 10), 0, 0, 360, (100, 100, 100), -1)
-        cv2.line(frame, (x - 15, y + 40), (x - 15, y + 80), COLOR_PLAYER_BODY, 10)
-        cv2.line(frame, (x + 15, y + 40), (x + 15, y + 80), COLOR_PLAYER_BODY, 10)
-        cv2.rectangle(frame, (x - 25, y), (x + 25, y + 50), COLOR_PLAYER_SHIRT, -1)
-        cv2.rectangle(frame, (x - 25, y), (x + 25, y + 50), (0, 0, 0), 2)
+        p = lambda dx, dy: self._p(x + dx * u, y + dy * u)
+        cv2.ellipse(frame, self._p(x, self.ground_y - 5 * u), self._p(35 * u, 10 * u), 0, 0, 360, (100, 100, 100), -1)
+        cv2.line(frame, p(-15, 40), p(-15, 80), COLOR_PLAYER_BODY, self._t(10))
+        cv2.line(frame, p(15, 40), p(15, 80), COLOR_PLAYER_BODY, self._t(10))
+        cv2.rectangle(frame, p(-25, 0), p(25, 50), COLOR_PLAYER_SHIRT, -1)
+        cv2.rectangle(frame, p(-25, 0), p(25, 50), (0, 0, 0), self._t(2))
         if hand_ready:
-            cv2.line(frame, (x - 25, y + 10), (x - 50, y - 30), COLOR_PLAYER_BODY, 8)
-            cv2.line(frame, (x + 25, y + 10), (x + 50, y + 20), COLOR_PLAYER_BODY, 8)
+            cv2.line(frame, p(-25, 10), p(-50, -30), COLOR_PLAYER_BODY, self._t(8))
+            cv2.line(frame, p(25, 10), p(50, 20), COLOR_PLAYER_BODY, self._t(8))
         else:
-            cv2.line(frame, (x - 25, y + 10), (x - 45, y + 40), COLOR_PLAYER_BODY, 8)
-            cv2.line(frame, (x + 25, y + 10), (x + 45, y + 40), COLOR_PLAYER_BODY, 8)
-        cv2.circle(frame, (x, y - 20), 22, COLOR_PLAYER_BODY, -1)
-        cv2.circle(frame, (x, y - 20), 22, (0, 0, 0), 2)
-        cv2.circle(frame, (x - 8, y - 23), 3, (0, 0, 0), -1)
-        cv2.circle(frame, (x + 8, y - 23), 3, (0, 0, 0), -1)
+            cv2.line(frame, p(-25, 10), p(-45, 40), COLOR_PLAYER_BODY, self._t(8))
+            cv2.line(frame, p(25, 10), p(45, 40), COLOR_PLAYER_BODY, self._t(8))
+        head_r = max(1, int(22 * u * self.scale))
+        eye_r = max(1, int(3 * u * self.scale))
+        cv2.circle(frame, p(0, -20), head_r, COLOR_PLAYER_BODY, -1)
+        cv2.circle(frame, p(0, -20), head_r, (0, 0, 0), self._t(2))
+        cv2.circle(frame, p(-8, -23), eye_r, (0, 0, 0), -1)
+        cv2.circle(frame, p(8, -23), eye_r, (0, 0, 0), -1)
 
     def draw_accuracy_bar(self, frame: np.ndarray, target_accuracy: int, current_level: float):
         """
@@ -62,27 +128,31 @@ class GameRenderer:
         - Target zone (kotak hijau)
         - Akurasi dihitung dari jarak target vs level suara
         """
-        bar_w, bar_h = 35, 300
-        x = 55
-        y = (self.height - bar_h) // 2
-        cv2.rectangle(frame, (x - 15, y - 40), (x + bar_w + 15, y + bar_h + 40), (0, 0, 0), -1)
-        cv2.rectangle(frame, (x - 15, y - 40), (x + bar_w + 15, y + bar_h + 40), (255, 255, 255), 3)
-        cv2.putText(frame, "VOLUME", (x - 10, y - 50), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
-        cv2.rectangle(frame, (x, y), (x + bar_w, y + bar_h), (255, 255, 255), 3)
-        fill_h = int((current_level / 100.0) * bar_h)
+        u = self.unit
+        bar_w, bar_h = 35 * u, 300 * u
+        x = 55 * u
+        y = (self.height - bar_h) / 2
+        cv2.rectangle(frame, self._p(x - 15 * u, y - 40 * u), self._p(x + bar_w + 15 * u, y + bar_h + 40 * u), (0, 0, 0), -1)
+        cv2.rectangle(frame, self._p(x - 15 * u, y - 40 * u), self._p(x + bar_w + 15 * u, y + bar_h + 40 * u), (255, 255, 255), self._t(3))
+        self._text(frame, "VOLUME", x - 10 * u, y - 50 * u, 0.5, (255, 255, 255), 2)
+        cv2.rectangle(frame, self._p(x, y), self._p(x + bar_w, y + bar_h), (255, 255, 255), self._t(3))
+        # gradasi digambar per baris piksel canvas
+        (cx1, cy1), (cx2, cy2) = self._p(x, y), self._p(x + bar_w, y + bar_h)
+        canvas_h = cy2 - cy1
+        fill_h = int((current_level / 100.0) * canvas_h)
         for i in range(fill_h):
-            ratio = i / max(1, bar_h)
+            ratio = i / max(1, canvas_h)
             if ratio < 0.33:
                 color = (0, int(50 + 205 * (ratio / 0.33)), 255)
             elif ratio < 0.66:
                 color = (0, 255, int(255 - 255 * ((ratio - 0.33) / 0.33)))
             else:
                 color = (0, 255, 0)
-            cv2.line(frame, (x, y + bar_h - i), (x + bar_w, y + bar_h - i), color, 1)
-        t_y = y + bar_h - int((target_accuracy / 100.0) * bar_h)
-        zone = 8
-        cv2.rectangle(frame, (x - 10, t_y - zone), (x + bar_w + 10, t_y + zone), (0, 255, 0), -1)
-        cv2.rectangle(frame, (x - 10, t_y - zone), (x + bar_w + 10, t_y + zone), (0, 200, 0), 2)
+            cv2.line(frame, (cx1, cy2 - i), (cx2, cy2 - i), color, 1)
+        t_y = y + bar_h - (target_accuracy / 100.0) * bar_h
+        zone = 8 * u
+        cv2.rectangle(frame, self._p(x - 10 * u, t_y - zone), self._p(x + bar_w + 10 * u, t_y + zone), (0, 255, 0), -1)
+        cv2.rectangle(frame, self._p(x - 10 * u, t_y - zone), self._p(x + bar_w + 10 * u, t_y + zone), (0, 200, 0), self._t(2))
         # cv2.putText(frame, f"{int(current_level)}%", (x + 5, y + bar_h + 25), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (122, 255, 255), 1)
         diff = abs(target_accuracy - current_level)
         accuracy = max(0, int(100 - diff))
@@ -94,44 +164,56 @@ class GameRenderer:
             acc_color, acc_text = (0, 165, 255), "CUKUP"
         else:
             acc_color, acc_text = (0, 0, 255), "KURANG"
-        cv2.putText(frame, f"{accuracy}%", (x - 5, y + bar_h + 55), cv2.FONT_HERSHEY_SIMPLEX, 0.6, acc_color, 2)
-        cv2.putText(frame, acc_text, (x - 10, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.45, acc_color, 2)
+        self._text(frame, f"{accuracy}%", x - 5 * u, y + bar_h + 55 * u, 0.6, acc_color, 2)
+        self._text(frame, acc_text, x - 10 * u, y - 10 * u, 0.45, acc_color, 2)
 
     def draw_hand_status(self, frame: np.ndarray, hand_ready: bool, shooting: bool):
         """Menampilkan status tangan: TAHAN / BUKA TANGAN / SHOOTING!"""
-        x, y = 50, 40
-        cv2.rectangle(frame, (x - 10, y - 10), (x + 180, y + 80), (0, 0, 0), -1)
-        cv2.rectangle(frame, (x - 10, y - 10), (x + 180, y + 80), (255, 255, 255), 2)
+        u = self.unit
+        x, y = 50 * u, 40 * u
+        cv2.rectangle(frame, self._p(x - 10 * u, y - 10 * u), self._p(x + 180 * u, y + 80 * u), (0, 0, 0), -1)
+        cv2.rectangle(frame, self._p(x - 10 * u, y - 10 * u), self._p(x + 180 * u, y + 80 * u), (255, 255, 255), self._t(2))
         if shooting:
             status, color = "SHOOTING!", (0, 255, 255)
         elif hand_ready:
             status, color = "TAHAN", (0, 255, 0)
         else:
             status, color = "BUKA TANGAN", (200, 200, 200)
-        cv2.putText(frame, "STATUS:", (x, y + 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        cv2.putText(frame, status, (x, y + 50), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        self._text(frame, "STATUS:", x, y + 20 * u, 0.5, (255, 255, 255), 1)
+        self._text(frame, status, x, y + 50 * u, 0.6, color, 2)
 
     def draw_controls_panel(self, frame: np.ndarray, time_remaining: float, score: int, miss: int, best_score: int):
         """Menampilkan panel kontrol: waktu, skor, miss, best score, instruksi tombol."""
-        x = self.width - 280
-        y = 20
-        cv2.rectangle(frame, (x, y), (x + 260, y + 180), (0, 0, 0), -1)
-        cv2.rectangle(frame, (x, y), (x + 260, y + 180), (255, 255, 255), 3)
+        u = self.unit
+        x = self.width - 280 * u
+        y = 20 * u
+        cv2.rectangle(frame, self._p(x, y), self._p(x + 260 * u, y + 180 * u), (0, 0, 0), -1)
+        cv2.rectangle(frame, self._p(x, y), self._p(x + 260 * u, y + 180 * u), (255, 255, 255), self._t(3))
         minutes = int(time_remaining // 60)
         seconds = int(time_remaining % 60)
         timer_color = (0, 255, 0) if time_remaining > 10 else (0, 0, 255)
-        cv2.putText(frame, f"TIME: {minutes:02d}:{seconds:02d}", (x + 20, y + 35), cv2.FONT_HERSHEY_SIMPLEX, 0.8, timer_color, 2)
-        cv2.putText(frame, f"SCORE: {score}", (x + 20, y + 70), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-        cv2.putText(frame, f"MISS: {miss}", (x + 20, y + 100), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-        cv2.putText(frame, f"BEST: {best_score}", (x + 20, y + 130), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 215, 0), 2)
-        cv2.putText(frame, "Q: QUIT | R: RESTART", (x + 10, y + 165), cv2.FONT_HERSHEY_SIMPLEX, 0.45, (200, 200, 200), 1)
+        self._text(frame, f"TIME: {minutes:02d}:{seconds:02d}", x + 20 * u, y + 35 * u, 0.8, timer_color, 2)
+        self._text(frame, f"SCORE: {score}", x + 20 * u, y + 70 * u, 0.7, (0, 255, 0), 2)
+        self._text(frame, f"MISS: {miss}", x + 20 * u, y + 100 * u, 0.7, (0, 0, 255), 2)
+        self._text(frame, f"BEST: {best_score}", x + 20 * u, y + 130 * u, 0.7, (255, 215, 0), 2)
+        self._text(frame, "Q: QUIT | R: RESTART", x + 10 * u, y + 165 * u, 0.45, (200, 200, 200), 1)
+
+    def draw_player_tag(self, frame: np.ndarray, label: str, divider: bool):
+        """Mode split-screen: label pemain di area lapangan dan garis pemisah di tepi kanan viewport."""
+        self._text(frame, label, 20 * self.unit, self.ground_y + 45 * self.unit, 0.9, (255, 255, 255), 2)
+        if divider:
+            edge = self.width - 2 * self.unit
+            cv2.line(frame, self._p(edge, 0), self._p(edge, self.height), (255, 255, 255), self._t(3))
 
     def draw_shot_result(self, frame: np.ndarray, accuracy: float, result: str, display_time: float):
         """Menampilkan hasil tembakan: SCORE! atau MISS! dengan efek fade out."""
         if time.time() - display_time < 2.0:
             alpha = max(0.0, 1.0 - (time.time() - display_time) / 2.0)
-            x = self.width // 2
-            y = 150
+            # viewport split-screen lebih sempit: teks diperkecil dan diletakkan di bawah panel kontrol
+            u = self.unit
+            ratio = min(1.0, self.width / (1280 * u))
+            x = self.width / 2 - 150 * u * ratio
+            y = (150 if ratio >= 1.0 else 235) * u
             if result == "score":
                 text = f"SCORE! Akurasi: {int(accuracy)}%"
                 color = (0, 255, 0)
@@ -139,51 +221,41 @@ class GameRenderer:
                 text = f"MISS! Akurasi: {int(accuracy)}%"
                 color = (0, 0, 255)
             fade_color = (int(color[0] * alpha), int(color[1] * alpha), int(color[2] * alpha))
-            cv2.putText(frame, text, (x - 150, y), cv2.FONT_HERSHEY_SIMPLEX, 1.2, fade_color, 3)
+            self._text(frame, text, x, y, 1.2 * ratio, fade_color, 3 if ratio >= 1.0 else 2)
 
     def draw_game_over(self, frame: np.ndarray, score: int, best_score: int):
         """Menampilkan layar Game Over dengan skor akhir dan instruksi restart/quit."""
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        self._dim(frame, 0.3)
+        u = self.unit
+        cx = self.width / 2
 
         # Judul Game Over
-        cv2.putText(frame, "GAME OVER!", (self.width // 2 - 200, 200),
-                    cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 0, 255), 4)
+        self._text(frame, "GAME OVER!", cx - 200 * u, 200 * u, 2.0, (0, 0, 255), 4)
 
         # Score
-        cv2.putText(frame, f"Final Score: {score}", (self.width // 2 - 150, 280),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.4, (255, 255, 255), 3)
-        cv2.putText(frame, f"Best Score: {best_score}", (self.width // 2 - 150, 330),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.4, (255, 215, 0), 3)
+        self._text(frame, f"Final Score: {score}", cx - 150 * u, 280 * u, 1.4, (255, 255, 255), 3)
+        self._text(frame, f"Best Score: {best_score}", cx - 150 * u, 330 * u, 1.4, (255, 215, 0), 3)
 
         # Instruksi permainan (seperti start screen)
-        cv2.putText(frame, "Instruksi Bermain:", (self.width // 2 - 200, 400),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 255, 255), 3)
-
-        cv2.putText(frame, "1. Buka tangan untuk siap", (self.width // 2 - 230, 450),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "2. Sesuaikan volume dengan target", (self.width // 2 - 230, 485),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "3. Kepal tangan untuk menahan", (self.width // 2 - 230, 520),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "4. Buka lagi untuk melempar", (self.width // 2 - 230, 555),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
+        self._text(frame, "Instruksi Bermain:", cx - 200 * u, 400 * u, 1.2, (0, 255, 255), 3)
+
+        self._text(frame, "1. Buka tangan untuk siap", cx - 230 * u, 450 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "2. Sesuaikan volume dengan target", cx - 230 * u, 485 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "3. Kepal tangan untuk menahan", cx - 230 * u, 520 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "4. Buka lagi untuk melempar", cx - 230 * u, 555 * u, 0.8, (200, 200, 200), 2)
 
         # Tombol restart / quit
-        cv2.putText(frame, "Press 'R' to Restart or 'Q' to Quit",
-                    (self.width // 2 - 260, 620),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
+        self._text(frame, "Press 'R' to Restart or 'Q' to Quit", cx - 260 * u, 620 * u, 0.9, (0, 255, 0), 2)
 
     def draw_start_screen(self, frame: np.ndarray):
         """Menampilkan layar awal dengan instruksi permainan."""
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (self.width, self.height), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
-        cv2.putText(frame, "VOICE FREE THROW", (self.width // 2 - 300, 200), cv2.FONT_HERSHEY_SIMPLEX, 2.0, (0, 255, 255), 4)
-        cv2.putText(frame, "Instruksi:", (self.width // 2 - 150, 300), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (255, 255, 255), 2)
-        cv2.putText(frame, "1. Buka tangan untuk siap", (self.width // 2 - 200, 350), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "2. Sesuaikan volume dengan target", (self.width // 2 - 200, 390), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "3. Kepal tangan untuk menahan", (self.width // 2 - 200, 430), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "4. Buka lagi untuk melempar", (self.width // 2 - 200, 470), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        cv2.putText(frame, "Press 'SPACE' to Start", (self.width // 2 - 180, 560), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
+        self._dim(frame, 0.3)
+        u = self.unit
+        cx = self.width / 2
+        self._text(frame, "VOICE FREE THROW", cx - 300 * u, 200 * u, 2.0, (0, 255, 255), 4)
+        self._text(frame, "Instruksi:", cx - 150 * u, 300 * u, 1.2, (255, 255, 255), 2)
+        self._text(frame, "1. Buka tangan untuk siap", cx - 200 * u, 350 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "2. Sesuaikan volume dengan target", cx - 200 * u, 390 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "3. Kepal tangan untuk menahan", cx - 200 * u, 430 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "4. Buka lagi untuk melempar", cx - 200 * u, 470 * u, 0.8, (200, 200, 200), 2)
+        self._text(frame, "Press 'SPACE' to Start", cx - 180 * u, 560 * u, 1.0, (0, 255, 0), 2)
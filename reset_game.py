@@ -14,6 +14,7 @@ def reset_game_state(state: GameState):
     state.game_over = False
     state.start_time = time.time()
     state.remaining_time = GAME_DURATION
+    state.hud_time = GAME_DURATION
     state.target_accuracy = random.randint(40, 95)
     state.last_shot_accuracy = None
     state.shot_result = None
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+
+class TaskStats:
+    """Statistik satu task: jumlah eksekusi, deadline miss, dan durasi langkah."""
+    def __init__(self, name: str, period: float):
+        self.name = name
+        self.period = period
+        self.runs = 0
+        self.misses = 0
+        self.skipped = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, duration: float):
+        ms = duration * 1000.0
+        self.runs += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> dict:
+        return {
+            "period_ms": self.period * 1000.0,
+            "runs": self.runs,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "mean_ms": self.total_ms / self.runs if self.runs else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+async def _call(step, *args):
+    """Memanggil step sync maupun coroutine."""
+    result = step(*args)
+    if asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+
+class Scheduler:
+    """
+    Scheduler asyncio multi-rate untuk game loop:
+    1. Task periodik dengan clock sendiri (misal fisika 120 Hz, render 60 Hz, HUD 1 Hz)
+    2. Task event-driven yang memproses hasil setiap kali sumbernya menghasilkan data (hand tracking)
+    3. Panggilan blocking (OpenCV/MediaPipe) dijalankan di executor lewat offload()
+    4. Counter deadline miss per task: task periodik yang baru bisa jalan setelah tick-nya lewat,
+       atau task event yang melebihi budget-nya
+    Tick yang terlewat tidak dikejar (dibuang) agar satu langkah lambat tidak menumpuk.
+    """
+    def __init__(self, workers: int = 2):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vft")
+        self._tasks: List[Callable[[], Awaitable[None]]] = []
+        self._stats: Dict[str, TaskStats] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    def add_periodic(self, name: str, hz: float, step: Callable):
+        """Menambahkan task yang dijalankan `hz` kali per detik."""
+        stats = self._stats[name] = TaskStats(name, 1.0 / hz)
+        self._tasks.append(lambda: self._run_periodic(stats, step))
+
+    def add_event(self, name: str, source: Callable, handler: Callable, budget: float):
+        """
+        Menambahkan task event-driven: `source` (sync/coroutine) menunggu data berikutnya,
+        `handler` dipanggil dengan data tersebut. Source mengembalikan None untuk berhenti.
+        Deadline miss dihitung jika handler lebih lama dari `budget` detik.
+        """
+        stats = self._stats[name] = TaskStats(name, budget)
+        self._tasks.append(lambda: self._run_event(stats, source, handler))
+
+    async def offload(self, fn: Callable, *args):
+        """Menjalankan fungsi blocking di executor tanpa menahan event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    @property
+    def running(self) -> bool:
+        return self._stop is not None and not self._stop.is_set()
+
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self):
+        """Menjalankan semua task hingga stop() dipanggil atau salah satu task selesai/error."""
+        self._stop = asyncio.Event()
+        tasks = [asyncio.create_task(make()) for make in self._tasks]
+        stopper = asyncio.create_task(self._stop.wait())
+        try:
+            done, _ = await asyncio.wait(tasks + [stopper], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is not stopper and task.exception():
+                    raise task.exception()
+        finally:
+            self._stop.set()
+            for task in tasks + [stopper]:
+                task.cancel()
+            await asyncio.gather(*tasks, stopper, return_exceptions=True)
+            self.executor.shutdown(wait=True)
+
+    async def _run_periodic(self, stats: TaskStats, step: Callable):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self.running:
+            next_tick += stats.period
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # langkah sebelumnya melewati tick ini: hitung miss dan buang tick yang sudah lewat
+                stats.misses += 1
+                skipped = int(-delay // stats.period)
+                stats.skipped += skipped
+                next_tick += skipped * stats.period
+                await asyncio.sleep(0)
+            t0 = time.perf_counter()
+            await _call(step)
+            stats.record(time.perf_counter() - t0)
+
+    async def _run_event(self, stats: TaskStats, source: Callable, handler: Callable):
+        while self.running:
+            # waktu menunggu source (misal kamera) tidak dihitung, hanya pemrosesan handler
+            item = await _call(source)
+            if item is None:
+                self.stop()
+                return
+            t0 = time.perf_counter()
+            await _call(handler, item)
+            duration = time.perf_counter() - t0
+            stats.record(duration)
+            if duration > stats.period:
+                stats.misses += 1
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: s.as_dict() for name, s in self._stats.items()}
+
+    def print_stats(self):
+        print(f"{'task':<10}{'period ms':>11}{'runs':>8}{'misses':>8}{'skipped':>9}{'mean ms':>9}{'max ms':>9}")
+        for name, s in self.stats().items():
+            print(f"{name:<10}{s['period_ms']:>11.2f}{s['runs']:>8}{s['misses']:>8}{s['skipped']:>9}"
+                  f"{s['mean_ms']:>9.3f}{s['max_ms']:>9.3f}")
@@ -0,0 +1,189 @@
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+from config import DB_FILE, STORE_BATCH_SIZE, STORE_FLUSH_INTERVAL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    player TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    score INTEGER NOT NULL DEFAULT 0,
+    miss INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS shots (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(id),
+    player TEXT NOT NULL,
+    target_accuracy REAL NOT NULL,
+    audio_level REAL NOT NULL,
+    accuracy REAL NOT NULL,
+    result TEXT NOT NULL,
+    shot_at REAL NOT NULL,
+    result_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS player_stats (
+    player TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL DEFAULT 0,
+    best_score INTEGER NOT NULL DEFAULT 0,
+    shots INTEGER NOT NULL DEFAULT 0,
+    made INTEGER NOT NULL DEFAULT 0,
+    accuracy_sum REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_score ON sessions(score DESC, ended_at) WHERE ended_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_sessions_player ON sessions(player, started_at);
+CREATE INDEX IF NOT EXISTS idx_shots_session ON shots(session_id);
+CREATE INDEX IF NOT EXISTS idx_shots_player_time ON shots(player, shot_at);
+CREATE INDEX IF NOT EXISTS idx_player_stats_best ON player_stats(best_score DESC);
+"""
+
+class ScoreStore:
+    """
+    Penyimpanan persisten sesi, tembakan, dan leaderboard berbasis SQLite:
+    1. Semua penulisan dimasukkan ke antrian dan ditulis thread background secara batch
+       (satu transaksi per batch) sehingga main loop tidak pernah menunggu disk
+    2. Agregat per pemain (player_stats) diperbarui secara incremental saat batch ditulis,
+       sehingga query leaderboard dan akurasi tetap cepat meski ada jutaan tembakan
+    3. Query baca memakai koneksi terpisah (mode WAL)
+    """
+    def __init__(self, path: str = DB_FILE, batch_size: int = STORE_BATCH_SIZE, flush_interval: float = STORE_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._thread: Optional[threading.Thread] = None
+        self.running = False
+        self.batches = 0
+        self.written = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def start(self):
+        """Memulai thread writer."""
+        self.running = True
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def flush(self):
+        """Menunggu hingga semua operasi di antrian selesai ditulis (tidak untuk main loop)."""
+        self._queue.join()
+
+    def close(self):
+        """Menulis sisa antrian ke database lalu menutup koneksi."""
+        if self.running:
+            self.running = False
+            self._queue.put(None)
+            self._thread.join()
+        self._reader.close()
+
+    # --- penulisan (non-blocking, dipanggil dari main loop) ---
+
+    def begin_session(self, player: str, started_at: Optional[float] = None) -> str:
+        session_id = uuid.uuid4().hex
+        self._queue.put(("begin", (session_id, player, started_at or time.time())))
+        return session_id
+
+    def log_shot(self, session_id: str, player: str, target_accuracy: float, audio_level: float,
+                 accuracy: float, result: str, shot_at: float, result_at: float):
+        self._queue.put(("shot", (session_id, player, target_accuracy, audio_level, accuracy, result, shot_at, result_at)))
+
+    def end_session(self, session_id: str, player: str, score: int, miss: int, ended_at: Optional[float] = None):
+        self._queue.put(("end", (session_id, player, score, miss, ended_at or time.time())))
+
+    # --- thread writer ---
+
+    def _write_loop(self):
+        """Mengumpulkan operasi dari antrian hingga batch_size atau flush_interval, lalu menulis dalam satu transaksi."""
+        conn = self._connect()
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(item)
+            try:
+                self._write_batch(conn, batch)
+            except Exception as e:
+                print("✗ score store write error:", e)
+            for _ in batch:
+                self._queue.task_done()
+        conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple]):
+        begins = [params for op, params in batch if op == "begin"]
+        shots = [params for op, params in batch if op == "shot"]
+        ends = [params for op, params in batch if op == "end"]
+        # agregasi per pemain di Python → satu upsert per pemain per batch
+        shot_stats: Dict[str, List[float]] = {}
+        for _, player, _, _, accuracy, result, _, _ in shots:
+            s = shot_stats.setdefault(player, [0, 0, 0.0])
+            s[0] += 1
+            s[1] += result == "score"
+            s[2] += accuracy
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO sessions (id, player, started_at) VALUES (?, ?, ?)", begins)
+            conn.executemany(
+                "INSERT INTO shots (session_id, player, target_accuracy, audio_level, accuracy, result, shot_at, result_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", shots)
+            conn.executemany(
+                "INSERT INTO player_stats (player, shots, made, accuracy_sum) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(player) DO UPDATE SET shots = shots + excluded.shots, made = made + excluded.made, "
+                "accuracy_sum = accuracy_sum + excluded.accuracy_sum",
+                [(player, n, made, acc) for player, (n, made, acc) in shot_stats.items()])
+            conn.executemany(
+                "UPDATE sessions SET score = ?, miss = ?, ended_at = ? WHERE id = ?",
+                [(score, miss, ended_at, session_id) for session_id, _, score, miss, ended_at in ends])
+            conn.executemany(
+                "INSERT INTO player_stats (player, sessions, best_score) VALUES (?, 1, ?) "
+                "ON CONFLICT(player) DO UPDATE SET sessions = sessions + 1, best_score = MAX(best_score, excluded.best_score)",
+                [(player, score) for _, player, score, _, _ in ends])
+        self.batches += 1
+        self.written += len(batch)
+
+    # --- query baca ---
+
+    def best_score(self, player: str) -> int:
+        row = self._reader.execute("SELECT best_score FROM player_stats WHERE player = ?", (player,)).fetchone()
+        return row[0] if row else 0
+
+    def top_sessions(self, n: int = 10) -> List[Tuple[str, int, int, float]]:
+        """Top-N sesi berdasarkan skor: (player, score, miss, ended_at)."""
+        return self._reader.execute(
+            "SELECT player, score, miss, ended_at FROM sessions WHERE ended_at IS NOT NULL "
+            "ORDER BY score DESC, ended_at LIMIT ?", (n,)).fetchall()
+
+    def top_players(self, n: int = 10) -> List[Tuple[str, int, int]]:
+        """Top-N pemain berdasarkan best score: (player, best_score, sessions)."""
+        return self._reader.execute(
+            "SELECT player, best_score, sessions FROM player_stats ORDER BY best_score DESC LIMIT ?", (n,)).fetchall()
+
+    def player_accuracy(self, player: str) -> Optional[Dict[str, float]]:
+        """Agregat akurasi pemain: jumlah tembakan, masuk, rata-rata akurasi, dan persentase masuk."""
+        row = self._reader.execute(
+            "SELECT shots, made, accuracy_sum FROM player_stats WHERE player = ?", (player,)).fetchone()
+        if not row or not row[0]:
+            return None
+        shots, made, accuracy_sum = row
+        return {"shots": shots, "made": made, "avg_accuracy": accuracy_sum / shots, "make_rate": 100.0 * made / shots}
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+from typing import List, Optional
+
+# nama tombol pada script → kode tombol cv2.waitKey
+KEY_NAMES = {"space": ord(' '), "r": ord('r'), "q": ord('q')}
+
+class ScriptedInput:
+    """
+    Sumber input headless untuk pengujian tanpa kamera, mikrofon, maupun jendela.
+    Script berupa list event JSON dengan waktu relatif `t` (detik) sejak game dimulai:
+        {"t": 0.5, "key": "space"}        tombol keyboard (space / r / q)
+        {"t": 1.0, "level": 85}           level suara mikrofon 0..100
+        {"t": 1.2, "shoot": 0}            gesture shoot untuk slot pemain 0
+    Event dengan waktu sama dijalankan berurutan sesuai posisi di script.
+    Script divalidasi saat dimuat (ValueError): nama tombol harus ada di KEY_NAMES dan
+    slot shoot harus berada di 0..num_players-1.
+    """
+    def __init__(self, events: List[dict], num_players: int = 1):
+        for i, event in enumerate(events):
+            self._validate(i, event, num_players)
+        self.events = sorted(events, key=lambda e: e["t"])
+        self._index = 0
+        self._start: Optional[float] = None
+
+    @classmethod
+    def from_file(cls, path: str, num_players: int = 1) -> "ScriptedInput":
+        with open(path, "r", encoding="utf-8") as f:
+            events = json.load(f)
+        if not isinstance(events, list):
+            raise ValueError(f"{path}: script must be a JSON list of events")
+        try:
+            return cls(events, num_players)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+
+    @staticmethod
+    def _validate(i: int, event: dict, num_players: int):
+        """Menolak event yang tidak valid sebelum game berjalan (bukan saat event dieksekusi)."""
+        if not isinstance(event, dict) or not isinstance(event.get("t"), (int, float)) or event["t"] < 0:
+            raise ValueError(f"script event {i}: expected an object with a non-negative time 't', got {event!r}")
+        if not any(field in event for field in ("key", "level", "shoot")):
+            raise ValueError(f"script event {i}: expected 'key', 'level' or 'shoot', got {event!r}")
+        if "key" in event and event["key"] not in KEY_NAMES:
+            raise ValueError(f"script event {i}: unknown key {event['key']!r} (expected one of {', '.join(KEY_NAMES)})")
+        if "level" in event and (not isinstance(event["level"], (int, float)) or not 0 <= event["level"] <= 100):
+            raise ValueError(f"script event {i}: level must be a number in 0..100, got {event['level']!r}")
+        if "shoot" in event and (not isinstance(event["shoot"], int) or isinstance(event["shoot"], bool)
+                                 or not 0 <= event["shoot"] < num_players):
+            raise ValueError(f"script event {i}: shoot slot must be an integer in 0..{num_players - 1}, got {event['shoot']!r}")
+
+    async def next_event(self) -> Optional[dict]:
+        """Menunggu hingga event berikutnya jatuh tempo; None jika script sudah habis."""
+        if self._start is None:
+            self._start = time.perf_counter()
+        if self._index >= len(self.events):
+            return None
+        event = self.events[self._index]
+        self._index += 1
+        delay = self._start + event["t"] - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return event
+
+    @staticmethod
+    def key_code(event: dict) -> int:
+        return KEY_NAMES[event["key"]]
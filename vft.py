@@ -1,5 +1,8 @@
+import argparse
+import asyncio
 import time
 import random
+from typing import List, Optional
 import cv2
 import numpy as np
 from config import *
@@ -11,146 +14,340 @@ from audio_player import AudioPlayer
 from game_state import GameState
 from reset_game import reset_game_state
 from kernel_video import enhance_frame
+from frame_pool import FrameBufferPool
+from recorder import SessionRecorder, PipeSink, open_sink
+from score_store import ScoreStore
+from scheduler import Scheduler
+from scripted_input import ScriptedInput
 
-def main():
-    """Fungsi utama untuk menjalankan game Voice Free Throw."""
-    audio_cap = AudioProcessor()
-    audio_cap.start()
-
-    audio_player = AudioPlayer()
-    if audio_player.has_audio:
-        audio_player.play_bgm()
-
-    hand_tracker = HandTracker()
-    renderer = GameRenderer(SCREEN_WIDTH, SCREEN_HEIGHT)
-    state = GameState()
-
-    cap = cv2.VideoCapture(0)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-    cv2.namedWindow('Voice Free Throw', cv2.WINDOW_NORMAL)
-    cv2.resizeWindow('Voice Free Throw', SCREEN_WIDTH, SCREEN_HEIGHT)
-
-    last_time = time.time()
-    print("\n✓ Game ready! Press SPACE to start. Q: Quit | R: Restart")
-
-    try:
-        while True:
-            ret, raw_frame = cap.read()
-            if not ret:
-                print("✗ Camera read failed.")
-                break
-
-            # proses frame untuk pelacakan tangan
-            hand_frame = enhance_frame(raw_frame.copy())
-
-            # delta waktu untuk update game
-            now = time.time()
-            dt = now - last_time
-            last_time = now
-            if dt <= 0:
-                dt = 1.0 / FPS
-
-            # update timer
-            if state.game_active and not state.game_over:
-                elapsed = now - state.start_time
-                state.remaining_time = max(0.0, GAME_DURATION - elapsed)
-                if state.remaining_time <= 0:
-                    state.game_active = False
-                    state.game_over = True
-                    if state.score > state.best_score:
-                        state.best_score = state.score
-                        #memutar sfx best score
-                        audio_player.play_best()
-
-            # pendeteksian tangan
-            should_shoot = hand_tracker.process(hand_frame)
-
-            # menembak bola jika kondisi terpenuhi
-            if should_shoot and not state.shooting and state.game_active and not state.game_over:
-                state.shooting = True
-                audio_level = audio_cap.level
-                diff = abs(state.target_accuracy - audio_level)
-                current_accuracy = max(0.0, 100.0 - diff)
-                state.last_shot_accuracy = current_accuracy
-                # buat objek bola baru
-                state.ball = Ball(renderer.player_x + 30, renderer.player_y - 20, renderer.basket_x, renderer.basket_y, current_accuracy, state.target_accuracy)
-
-            #  rendering frame
-            frame = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
-            renderer.draw_background(frame)
-            renderer.draw_basket(frame)
-            renderer.draw_player(frame, hand_ready=not state.shooting)
-
-            # update dan gambar bola jika ada
-            if state.ball and state.ball.active:
-                result = state.ball.update(dt, renderer.basket_x, renderer.basket_y, renderer.basket_rim_radius)
-                state.ball.draw(frame)
-                if result == "score":
-                    state.score += 1
-                    state.shooting = False
-                    state.ball = None
-                    state.target_accuracy = random.randint(40, 95)
-                    state.shot_result = "score"
-                    state.result_display_time = now
-                    audio_player.play_score()
-                    # cek best score
-                    if state.score > state.best_score:
-                        state.best_score = state.score
-                        audio_player.play_best()
-                elif result == "miss":
-                    state.miss += 1
-                    state.shooting = False
-                    state.ball = None
-                    state.target_accuracy = random.randint(40, 95)
-                    state.shot_result = "miss"
-                    state.result_display_time = now
-                    audio_player.play_miss()
-
-            # UI
-            if state.game_active and not state.game_over:
-                if not state.shooting:
-                    renderer.draw_accuracy_bar(frame, state.target_accuracy, audio_cap.level)
-                renderer.draw_hand_status(frame, hand_ready=not state.shooting, shooting=state.shooting)
-                if state.last_shot_accuracy is not None and state.shot_result:
-                    renderer.draw_shot_result(frame, state.last_shot_accuracy, state.shot_result, state.result_display_time)
-
-            renderer.draw_controls_panel(frame, state.remaining_time, state.score, state.miss, state.best_score)
-
-            # overlay
-            if not state.game_active:
-                if state.game_over:
-                    renderer.draw_game_over(frame, state.score, state.best_score)
-                else:
-                    renderer.draw_start_screen(frame)
-
-            # preview tangan
-            try:
-                preview = cv2.resize(hand_frame, (220, 165))
-                frame[SCREEN_HEIGHT - 185:SCREEN_HEIGHT - 20, SCREEN_WIDTH - 240:SCREEN_WIDTH - 20] = preview
-                cv2.rectangle(frame, (SCREEN_WIDTH - 240, SCREEN_HEIGHT - 185), (SCREEN_WIDTH - 20, SCREEN_HEIGHT - 20), (0, 255, 0), 2)
-            except Exception:
-                pass
-            cv2.imshow('Voice Free Throw', frame)
-
-            # keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-            elif key == ord('r'):
-                reset_game_state(state)
-            elif key == ord(' ') and not state.game_active and not state.game_over:
-                reset_game_state(state)
-
-    finally:
+def end_session(store: ScoreStore, state: GameState, now: Optional[float] = None):
+    """Menutup sesi pemain di ScoreStore dengan skor akhir (sekali per sesi)."""
+    if state.session_open:
+        store.end_session(state.session_id, state.player, state.score, state.miss, now)
+        state.session_open = False
+
+def start_session(store: ScoreStore, states: List[GameState]):
+    """Menutup sesi yang masih berjalan (restart di tengah game), lalu memulai sesi baru untuk semua pemain."""
+    for state in states:
+        end_session(store, state)
+        reset_game_state(state)
+        state.session_id = store.begin_session(state.player, state.start_time)
+        state.session_open = True
+
+def try_shoot(state: GameState, renderer: GameRenderer, audio_level: float, now: float):
+    """Menembak bola jika kondisi terpenuhi (dipanggil saat tracker mendeteksi gesture shoot)."""
+    if state.shooting or not state.game_active or state.game_over:
+        return
+    state.shooting = True
+    diff = abs(state.target_accuracy - audio_level)
+    current_accuracy = max(0.0, 100.0 - diff)
+    state.last_shot_accuracy = current_accuracy
+    state.shot_time = now
+    state.shot_audio_level = audio_level
+    # buat objek bola baru
+    state.ball = Ball(renderer.release_x, renderer.release_y, renderer.basket_x, renderer.basket_y, current_accuracy, state.target_accuracy,
+                      bounds=(renderer.width, renderer.height), unit=renderer.unit)
+
+def update_physics(state: GameState, renderer: GameRenderer, dt: float, now: float, store: ScoreStore, audio_player: AudioPlayer):
+    """Update timer permainan dan fisika bola satu pemain dengan timestep tetap."""
+    # update timer
+    if state.game_active and not state.game_over:
+        elapsed = now - state.start_time
+        state.remaining_time = max(0.0, GAME_DURATION - elapsed)
+        if state.remaining_time <= 0:
+            state.game_active = False
+            state.game_over = True
+            state.hud_time = 0.0
+            # bola yang masih melayang tetap dihitung; sesi ditutup setelah bola tersebut selesai
+            if not (state.ball and state.ball.active):
+                end_session(store, state, now)
+            if state.score > state.best_score:
+                state.best_score = state.score
+                #memutar sfx best score
+                audio_player.play_best()
+
+    # update bola jika ada
+    if state.ball and state.ball.active:
+        result = state.ball.update(dt, renderer.basket_x, renderer.basket_y, renderer.basket_rim_radius)
+        if result and state.session_id:
+            store.log_shot(state.session_id, state.player, state.target_accuracy, state.shot_audio_level,
+                           state.last_shot_accuracy, result, state.shot_time, now)
+        if result == "score":
+            state.score += 1
+            state.shooting = False
+            state.ball = None
+            state.target_accuracy = random.randint(40, 95)
+            state.shot_result = "score"
+            state.result_display_time = now
+            audio_player.play_score()
+            # cek best score
+            if state.score > state.best_score:
+                state.best_score = state.score
+                audio_player.play_best()
+        elif result == "miss":
+            state.miss += 1
+            state.shooting = False
+            state.ball = None
+            state.target_accuracy = random.randint(40, 95)
+            state.shot_result = "miss"
+            state.result_display_time = now
+            audio_player.play_miss()
+        if result and state.game_over:
+            end_session(store, state, now)
+
+def draw_player_view(state: GameState, renderer: GameRenderer, frame: np.ndarray, audio_level: float):
+    """Menggambar viewport satu pemain dari state terakhir (tanpa mengubah state) ke target renderer.begin()."""
+    # draw_background menimpa seluruh viewport, tidak perlu dikosongkan
+    renderer.draw_background(frame)
+    renderer.draw_basket(frame)
+    renderer.draw_player(frame, hand_ready=not state.shooting)
+    if state.ball and state.ball.active:
+        state.ball.draw(frame, renderer.scale)
+
+    # UI
+    if state.game_active and not state.game_over:
+        if not state.shooting:
+            renderer.draw_accuracy_bar(frame, state.target_accuracy, audio_level)
+        renderer.draw_hand_status(frame, hand_ready=not state.shooting, shooting=state.shooting)
+        if state.last_shot_accuracy is not None and state.shot_result:
+            renderer.draw_shot_result(frame, state.last_shot_accuracy, state.shot_result, state.result_display_time)
+
+    renderer.draw_controls_panel(frame, state.hud_time, state.score, state.miss, state.best_score)
+
+    # overlay
+    if not state.game_active:
+        if state.game_over:
+            renderer.draw_game_over(frame, state.score, state.best_score)
+        else:
+            renderer.draw_start_screen(frame)
+
+
+class VoiceFreeThrow:
+    """
+    Game Voice Free Throw di atas scheduler asyncio multi-rate:
+    - physics  : timer & bola pada PHYSICS_HZ (timestep tetap, dengan accumulator
+                 untuk mengejar tick yang terlewat)
+    - render   : menggambar & menampilkan frame pada FPS, termasuk input keyboard
+    - hud      : teks timer HUD pada HUD_HZ
+    - audio    : polling level mikrofon pada AUDIO_POLL_HZ
+    - recorder : status rekaman per output setiap RECORD_STATS_INTERVAL detik (jika merekam)
+    - tracking : hasil hand tracking diproses setiap kali kamera menghasilkan frame
+                 (cap.read, enhance_frame, dan MediaPipe dijalankan di executor)
+    Dengan `script`, game berjalan headless: kamera, mikrofon, keyboard, dan jendela
+    diganti ScriptedInput.
+    """
+    def __init__(self, num_players: int = 1, player: str = DEFAULT_PLAYER, db_path: str = DB_FILE,
+                 record_path: Optional[str] = None, stream_path: Optional[str] = None,
+                 script: Optional[ScriptedInput] = None, render_scale: float = RENDER_SCALE):
+        self.num_players = num_players
+        self.script = script
+        self.headless = script is not None
+        self.audio_level = 0.0
+
+        self.audio_cap = None if self.headless else AudioProcessor()
+        self.audio_player = AudioPlayer(enabled=not self.headless)
+        # satu HandTracker (satu inferensi per frame) untuk semua pemain
+        self.hand_tracker = None if self.headless else HandTracker(num_players)
+        self.cap = None
+        self.store = ScoreStore(db_path)
+        self.buffers = FrameBufferPool(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # setiap pemain mendapat viewport (view numpy ke frame output), renderer, dan GameState sendiri
+        view_w = SCREEN_WIDTH // num_players
+        self.views = [self.buffers.frame[:, i * view_w:(i + 1) * view_w] for i in range(num_players)]
+        self.renderers = [GameRenderer(view_w, SCREEN_HEIGHT, scale=render_scale, crisp_text=CRISP_TEXT) for _ in range(num_players)]
+        names = [player] if num_players == 1 else [f"{player}{i + 1}" for i in range(num_players)]
+        self.states = [GameState(player=name, best_score=self.store.best_score(name)) for name in names]
+
+        self.recorder = None
+        sinks = []
+        if record_path:
+            sinks.append(open_sink(record_path))
+        if stream_path:
+            sinks.append(PipeSink(stream_path))
+        if sinks:
+            self.recorder = SessionRecorder(sinks)
+
+        self._physics_clock: Optional[float] = None
+        self._physics_acc = 0.0
+
+        self.scheduler = Scheduler()
+        self.scheduler.add_periodic("physics", PHYSICS_HZ, self.physics_step)
+        self.scheduler.add_periodic("render", FPS, self.render_step)
+        self.scheduler.add_periodic("hud", HUD_HZ, self.hud_step)
+        if self.recorder:
+            self.scheduler.add_periodic("recorder", 1.0 / RECORD_STATS_INTERVAL, self.recorder_step)
+        if self.headless:
+            self.scheduler.add_event("script", self.script.next_event, self.on_script_event, budget=1.0 / FPS)
+        else:
+            self.scheduler.add_periodic("audio", AUDIO_POLL_HZ, self.audio_step)
+            self.scheduler.add_event("tracking", self.read_camera, self.on_camera_frame, budget=1.0 / CAMERA_FPS)
+
+    # --- task periodik ---
+
+    def physics_step(self):
+        """
+        Menjalankan update_physics dengan timestep tetap 1/PHYSICS_HZ sebanyak langkah yang sudah
+        lewat sejak tick sebelumnya (tick yang dibuang scheduler tetap dikejar), maksimal
+        PHYSICS_MAX_STEPS langkah. Jika tertinggal lebih jauh (misal jendela di-drag), sisa waktu
+        dibuang: bola melambat sesaat, tetapi timestep tidak pernah membesar sehingga deteksi ring tetap akurat.
+        """
+        dt = 1.0 / PHYSICS_HZ
+        clock = time.perf_counter()
+        elapsed = dt if self._physics_clock is None else clock - self._physics_clock
+        self._physics_clock = clock
+        self._physics_acc = min(self._physics_acc + elapsed, PHYSICS_MAX_STEPS * dt)
+        steps = int(self._physics_acc // dt)
+        self._physics_acc -= steps * dt
+        now = time.time()
+        for _ in range(steps):
+            for state, renderer in zip(self.states, self.renderers):
+                update_physics(state, renderer, dt, now, self.store, self.audio_player)
+
+    def hud_step(self):
+        for state in self.states:
+            state.hud_time = state.remaining_time
+
+    def audio_step(self):
+        self.audio_level = self.audio_cap.level
+
+    def recorder_step(self):
+        """Mencetak kedalaman antrian dan jumlah frame ditulis/dibuang setiap output rekaman."""
+        stats = self.recorder.stats()
+        sinks = " | ".join(f"{path}: queue {sink['queue_depth']}/{self.recorder.queue_size}, "
+                           f"{sink['written']} written, {sink['dropped']} dropped"
+                           for path, sink in stats["sinks"].items())
+        print(f"● Recording: {stats['submitted']} frames submitted | {sinks}")
+
+    def render_step(self):
+        frame = self.buffers.frame
+        for i, (state, renderer, view) in enumerate(zip(self.states, self.renderers, self.views)):
+            # gambar di resolusi internal, lalu satu upscale ke viewport output
+            target = renderer.begin(view)
+            draw_player_view(state, renderer, target, self.audio_level)
+            if self.num_players > 1:
+                renderer.draw_player_tag(target, f"P{i + 1}: {state.player}", divider=i < self.num_players - 1)
+            renderer.present(view)
+
+        # preview tangan hasil resize terakhir dari task tracking
+        np.copyto(self.buffers.preview, self.buffers.preview_src)
+        cv2.rectangle(frame, *self.buffers.preview_rect, (0, 255, 0), 2)
+        if self.recorder:
+            self.recorder.submit(frame, time.time())
+        if self.headless:
+            return
+        cv2.imshow('Voice Free Throw', frame)
+
+        # keyboard input
+        self.handle_key(cv2.waitKey(1) & 0xFF)
+
+    # --- task event-driven ---
+
+    async def read_camera(self) -> Optional[np.ndarray]:
+        ret, raw_frame = await self.scheduler.offload(self.cap.read, self.buffers.raw)
+        if not ret:
+            print("✗ Camera read failed.")
+            return None
+        return raw_frame
+
+    def _track(self, raw_frame: np.ndarray) -> List[bool]:
+        """Dijalankan di executor: enhance frame lalu satu inferensi MediaPipe untuk semua pemain."""
+        # proses frame untuk pelacakan tangan (ditulis ke buffer pool, raw_frame tidak diubah)
+        self.buffers.bind_camera(raw_frame.shape)
+        hand_frame = enhance_frame(raw_frame, out=self.buffers.hand, work=self.buffers.work)
+        return self.hand_tracker.process_players(hand_frame, rgb=self.buffers.rgb)
+
+    async def on_camera_frame(self, raw_frame: np.ndarray):
+        shoots = await self.scheduler.offload(self._track, raw_frame)
+        # resize preview di thread event loop agar tidak bentrok dengan render_step
+        cv2.resize(self.buffers.hand, (PREVIEW_WIDTH, PREVIEW_HEIGHT), dst=self.buffers.preview_src)
+        now = time.time()
+        for state, renderer, should_shoot in zip(self.states, self.renderers, shoots):
+            if should_shoot:
+                try_shoot(state, renderer, self.audio_level, now)
+
+    def on_script_event(self, event: dict):
+        if "level" in event:
+            self.audio_level = float(event["level"])
+        if "shoot" in event:
+            slot = event["shoot"]
+            try_shoot(self.states[slot], self.renderers[slot], self.audio_level, time.time())
+        if "key" in event:
+            self.handle_key(ScriptedInput.key_code(event))
+
+    def handle_key(self, key: int):
+        if key == ord('q'):
+            self.scheduler.stop()
+        elif key == ord('r'):
+            start_session(self.store, self.states)
+        elif key == ord(' ') and not self.states[0].game_active and not self.states[0].game_over:
+            start_session(self.store, self.states)
+
+    # --- lifecycle ---
+
+    def run(self):
+        self.store.start()
+        if self.recorder:
+            self.recorder.start()
+        if not self.headless:
+            self.audio_cap.start()
+            if self.audio_player.has_audio:
+                self.audio_player.play_bgm()
+            self.cap = cv2.VideoCapture(0)
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+            cv2.namedWindow('Voice Free Throw', cv2.WINDOW_NORMAL)
+            cv2.resizeWindow('Voice Free Throw', SCREEN_WIDTH, SCREEN_HEIGHT)
+            print("\n✓ Game ready! Press SPACE to start. Q: Quit | R: Restart")
+        try:
+            asyncio.run(self.scheduler.run())
+        finally:
+            self.close()
+
+    def close(self):
         # cleanup
-        audio_cap.stop()
-        audio_player.stop_bgm()
-        audio_player.quit()
-        cap.release()
-        cv2.destroyAllWindows()
-        print("\n✓ Game ended. Best Score:", state.best_score)
+        for state in self.states:
+            end_session(self.store, state)
+        self.store.close()
+        if not self.headless:
+            self.audio_cap.stop()
+            self.audio_player.stop_bgm()
+            self.audio_player.quit()
+            self.cap.release()
+            cv2.destroyAllWindows()
+        if self.recorder:
+            self.recorder.stop()
+            for path, sink in self.recorder.stats()["sinks"].items():
+                print(f"✓ Recording saved ({path}): {sink['written']} frames written, {sink['dropped']} dropped")
+        self.scheduler.print_stats()
+        for state in self.states:
+            print(f"\n✓ Game ended. {state.player} Best Score:", state.best_score)
+
+def main(record_path=None, stream_path=None, player=DEFAULT_PLAYER, db_path=DB_FILE, num_players=1, script_path=None,
+         render_scale=RENDER_SCALE):
+    """Fungsi utama untuk menjalankan game Voice Free Throw.
+    record_path / stream_path (opsional): file video dan/atau named pipe untuk rekaman sesi.
+    player / db_path: nama pemain dan database SQLite untuk riwayat sesi & leaderboard.
+    num_players: jumlah pemain split-screen yang berbagi satu kamera dan mikrofon.
+    script_path (opsional): script input JSON untuk mode headless (tanpa kamera/mikrofon/jendela).
+    render_scale: skala resolusi render internal terhadap resolusi output (1.0 = tanpa upscale, tercepat saat ini).
+    """
+    script = ScriptedInput.from_file(script_path, num_players) if script_path else None
+    game = VoiceFreeThrow(num_players=num_players, player=player, db_path=db_path,
+                          record_path=record_path, stream_path=stream_path, script=script, render_scale=render_scale)
+    game.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Voice Free Throw")
+    parser.add_argument("--record", metavar="PATH", help="rekam sesi ke file video (mp4/avi)")
+    parser.add_argument("--stream", metavar="FIFO", help="kirim frame BGR mentah ke named pipe untuk spectator")
+    parser.add_argument("--player", default=DEFAULT_PLAYER, help="nama pemain untuk riwayat sesi & leaderboard")
+    parser.add_argument("--db", default=DB_FILE, help="path database SQLite")
+    parser.add_argument("--players", type=int, default=1, choices=range(1, MAX_PLAYERS + 1), help="jumlah pemain split-screen")
+    parser.add_argument("--headless", metavar="SCRIPT", help="jalankan headless dengan script input JSON")
+    parser.add_argument("--render-scale", type=float, default=RENDER_SCALE, help="skala resolusi render internal (0 < s <= 1; < 1 saat ini lebih lambat, lihat benchmark.py render)")
+    args = parser.parse_args()
+    if not 0.0 < args.render_scale <= 1.0:
+        parser.error(f"--render-scale must be in (0, 1], got {args.render_scale}")
+    main(record_path=args.record, stream_path=args.stream, player=args.player, db_path=args.db,
+         num_players=args.players, script_path=args.headless, render_scale=args.render_scale)
\ No newline at end of file